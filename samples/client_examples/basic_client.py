@@ -1,6 +1,10 @@
 """Basic A2A client example."""
 
+import argparse
 import asyncio
+import statistics
+import sys
+import time
 import uuid
 from a2a.client.a2a_client import A2AClient
 from a2a.client.card_resolver import A2ACardResolver
@@ -9,193 +13,255 @@ from a2a.models.task import TaskSendParams
 from a2a.exceptions import A2AClientException, TaskNotFoundException
 
 
-async def demonstrate_agent_discovery():
+def _mkid() -> str:
+    """Generate a random identifier (hex form skips UUID dash formatting)."""
+    return uuid.uuid4().hex
+
+
+_USER = MessageRole.USER
+
+
+def user_message(text: str) -> Message:
+    """Build a user message with fresh message and context ids."""
+    return Message(
+        role=_USER,
+        message_id=_mkid(),
+        context_id=_mkid(),
+        parts=[TextPart(text=text)]
+    )
+
+
+# Maximum number of buffered output lines before a streaming demo flushes
+_FLUSH_THRESHOLD = 32
+
+
+def _flush(output: list) -> None:
+    """Write buffered output lines with a single write call and clear the buffer."""
+    if output:
+        sys.stdout.write("\n".join(output) + "\n")
+        output.clear()
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command-line integer that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+async def demonstrate_agent_discovery(resolver: A2ACardResolver):
     """Demonstrate agent discovery capabilities."""
-    print("=== Agent Discovery ===")
+    output = ["=== Agent Discovery ==="]
     
     try:
-        # Create card resolver
-        resolver = A2ACardResolver("http://localhost:8000")
-        
         # Get agent card
         agent_card = await resolver.get_agent_card("/echo")
-        print(f"Found agent: {agent_card.name}")
-        print(f"Description: {agent_card.description}")
-        print(f"Version: {agent_card.version}")
-        print(f"Capabilities: {agent_card.capabilities.model_dump()}")
-        print(f"Skills: {len(agent_card.skills)} skills available")
-        
-        await resolver.close()
+        output.append(f"Found agent: {agent_card.name}")
+        output.append(f"Description: {agent_card.description}")
+        output.append(f"Version: {agent_card.version}")
+        output.append(f"Capabilities: {agent_card.capabilities.model_dump_json()}")
+        output.append(f"Skills: {len(agent_card.skills)} skills available")
         
     except A2AClientException as e:
-        print(f"Error discovering agent: {e}")
+        output.append(f"Error discovering agent: {e}")
+    finally:
+        _flush(output)
 
 
-async def demonstrate_message_communication():
+async def demonstrate_message_communication(client: A2AClient):
     """Demonstrate direct message communication."""
-    print("\n=== Message Communication ===")
+    output = ["\n=== Message Communication ==="]
     
     try:
-        # Create client
-        client = A2AClient("http://localhost:8000/echo")
-        
         # Create a message
-        message = Message(
-            role=MessageRole.USER,
-            message_id=str(uuid.uuid4()),
-            context_id=str(uuid.uuid4()),
-            parts=[TextPart(text="Hello from Python A2A client!")]
-        )
+        message = user_message("Hello from Python A2A client!")
         
-        print(f"Sending message: {message.parts[0].text}")
+        output.append(f"Sending message: {message.parts[0].text}")
         
         # Send message and get response
         response = await client.send_message(message)
-        print(f"Received response: {response.parts[0].text}")
-        
-        await client.close()
+        output.append(f"Received response: {response.parts[0].text}")
         
     except A2AClientException as e:
-        print(f"Error in message communication: {e}")
+        output.append(f"Error in message communication: {e}")
+    finally:
+        _flush(output)
 
 
-async def demonstrate_streaming_communication():
+async def demonstrate_streaming_communication(client: A2AClient):
     """Demonstrate streaming message communication."""
-    print("\n=== Streaming Communication ===")
+    output = ["\n=== Streaming Communication ==="]
     
     try:
-        # Create client
-        client = A2AClient("http://localhost:8000/echo")
-        
         # Create a message
-        message = Message(
-            role=MessageRole.USER,
-            message_id=str(uuid.uuid4()),
-            context_id=str(uuid.uuid4()),
-            parts=[TextPart(text="Hello from streaming client!")]
-        )
+        message = user_message("Hello from streaming client!")
         
-        print(f"Sending streaming message: {message.parts[0].text}")
+        output.append(f"Sending streaming message: {message.parts[0].text}")
         
         # Send message and stream response
         async for event in client.send_message_stream(message):
-            print(f"Streaming event: {event}")
-        
-        await client.close()
+            output.append(f"Streaming event: {event}")
+            if len(output) >= _FLUSH_THRESHOLD:
+                _flush(output)
         
     except A2AClientException as e:
-        print(f"Error in streaming communication: {e}")
+        output.append(f"Error in streaming communication: {e}")
+    finally:
+        _flush(output)
 
 
-async def demonstrate_task_communication():
+async def demonstrate_task_communication(client: A2AClient):
     """Demonstrate task-based communication."""
-    print("\n=== Task Communication ===")
+    output = ["\n=== Task Communication ==="]
     
     try:
-        # Create client
-        client = A2AClient("http://localhost:8000/echo")
-        
         # Create task parameters
-        message = Message(
-            role=MessageRole.USER,
-            message_id=str(uuid.uuid4()),
-            context_id=str(uuid.uuid4()),
-            parts=[TextPart(text="Hello from task-based client!")]
-        )
+        message = user_message("Hello from task-based client!")
         
         task_params = TaskSendParams(
-            session_id=str(uuid.uuid4()),
+            session_id=_mkid(),
             message=message
         )
         
-        print(f"Creating task with message: {message.parts[0].text}")
+        output.append(f"Creating task with message: {message.parts[0].text}")
         
         # Create task
         task = await client.create_task(task_params)
-        print(f"Created task: {task.id}")
-        print(f"Task status: {task.status.state}")
+        output.append(f"Created task: {task.id}")
+        output.append(f"Task status: {task.status.state}")
         
         # Get task details
         retrieved_task = await client.get_task(task.id)
-        print(f"Retrieved task history length: {len(retrieved_task.history or [])}")
-        
-        if retrieved_task.history:
-            for i, msg in enumerate(retrieved_task.history):
-                print(f"  Message {i+1} ({msg.role}): {msg.parts[0].text}")
-        
-        await client.close()
+        history = retrieved_task.history or ()
+        output.append(f"Retrieved task history length: {len(history)}")
+
+        for i, msg in enumerate(history, 1):
+            parts = msg.parts
+            text = parts[0].text if parts else ""
+            output.append(f"  Message {i} ({msg.role}): {text}")
         
     except A2AClientException as e:
-        print(f"Error in task communication: {e}")
+        output.append(f"Error in task communication: {e}")
     except TaskNotFoundException as e:
-        print(f"Task not found: {e}")
+        output.append(f"Task not found: {e}")
+    finally:
+        _flush(output)
 
 
-async def demonstrate_task_streaming():
+async def demonstrate_task_streaming(client: A2AClient):
     """Demonstrate task-based streaming communication."""
-    print("\n=== Task Streaming Communication ===")
+    output = ["\n=== Task Streaming Communication ==="]
     
     try:
-        # Create client
-        client = A2AClient("http://localhost:8000/echo")
-        
         # Create initial task
-        message = Message(
-            role=MessageRole.USER,
-            message_id=str(uuid.uuid4()),
-            context_id=str(uuid.uuid4()),
-            parts=[TextPart(text="Initial task message")]
-        )
+        message = user_message("Initial task message")
         
         task_params = TaskSendParams(
-            session_id=str(uuid.uuid4()),
+            session_id=_mkid(),
             message=message
         )
         
         task = await client.create_task(task_params)
-        print(f"Created task: {task.id}")
+        output.append(f"Created task: {task.id}")
         
         # Send another message to the task with streaming
-        follow_up_message = Message(
-            role=MessageRole.USER,
-            message_id=str(uuid.uuid4()),
-            context_id=str(uuid.uuid4()),
-            parts=[TextPart(text="Follow-up streaming message")]
-        )
+        follow_up_message = user_message("Follow-up streaming message")
         
         follow_up_params = TaskSendParams(
             message=follow_up_message
         )
         
-        print(f"Sending follow-up message: {follow_up_message.parts[0].text}")
+        output.append(f"Sending follow-up message: {follow_up_message.parts[0].text}")
         
         # Stream the response
         async for event in client.send_task_message_stream(task.id, follow_up_params):
-            print(f"Task streaming event: {event}")
-        
-        await client.close()
+            output.append(f"Task streaming event: {event}")
+            if len(output) >= _FLUSH_THRESHOLD:
+                _flush(output)
         
     except A2AClientException as e:
-        print(f"Error in task streaming: {e}")
+        output.append(f"Error in task streaming: {e}")
+    finally:
+        _flush(output)
 
 
-async def main():
-    """Run all demonstration examples."""
+async def run_load_test(client: A2AClient, concurrency: int, iterations: int):
+    """Send many messages concurrently and report latency percentiles."""
+    print(f"\n=== Load Test ({iterations} messages, concurrency {concurrency}) ===")
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    
+    async def send_one():
+        message = user_message("Hello from load test!")
+        async with semaphore:
+            start = time.perf_counter()
+            await client.send_message(message)
+            latencies.append(time.perf_counter() - start)
+    
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(send_one() for _ in range(iterations)),
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - started
+    
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        print(f"Failed requests: {len(errors)} (first error: {errors[0]})")
+    if not latencies:
+        return
+    
+    p50 = statistics.median(latencies)
+    # quantiles() needs at least two data points
+    p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else p50
+    print(f"Completed: {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.1f} req/s)")
+    print(f"Latency: p50={p50 * 1000:.1f}ms p99={p99 * 1000:.1f}ms")
+
+
+async def main(concurrency: int = 1, iterations: int = 1):
+    """Run all demonstration examples, or a load test when requested."""
     print("A2A Python Client Examples")
     print("=" * 50)
     print("Make sure the echo agent is running at http://localhost:8000/echo")
     print("You can start it with: python samples/echo_agent/main.py")
     print()
     
-    # Run all demonstrations
-    await demonstrate_agent_discovery()
-    await demonstrate_message_communication()
-    await demonstrate_streaming_communication()
-    await demonstrate_task_communication()
-    await demonstrate_task_streaming()
+    # Share one client and resolver so every demonstration reuses the same
+    # connection pool instead of opening new connections
+    async with A2AClient("http://localhost:8000/echo") as client, \
+            A2ACardResolver("http://localhost:8000") as resolver:
+        if concurrency > 1 or iterations > 1:
+            await run_load_test(client, concurrency, iterations)
+            return
+        
+        # The demonstrations are independent, so run them concurrently;
+        # each one buffers its output and prints it as a single block
+        await asyncio.gather(
+            demonstrate_agent_discovery(resolver),
+            demonstrate_message_communication(client),
+            demonstrate_streaming_communication(client),
+            demonstrate_task_communication(client),
+            demonstrate_task_streaming(client),
+        )
     
     print("\n=== All Examples Completed ===")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="A2A Python client examples")
+    parser.add_argument(
+        "--concurrency", type=_positive_int, default=1,
+        help="Maximum number of in-flight requests in load test mode"
+    )
+    parser.add_argument(
+        "--iterations", type=_positive_int, default=1,
+        help="Number of messages to send in load test mode"
+    )
+    args = parser.parse_args()
+    
+    asyncio.run(main(args.concurrency, args.iterations))
@@ -1,13 +1,29 @@
 """Simple echo agent implementation using A2A Python SDK."""
 
+import hashlib
+import json
+import os
+import sys
 import uuid
-from fastapi import FastAPI
+from importlib.util import find_spec
+from fastapi import FastAPI, Response
+from starlette.datastructures import Headers, MutableHeaders
 from a2a.server.task_manager import TaskManager
+from a2a.server.task_store import RedisTaskStore
 from a2a.models.message import Message, MessageRole, TextPart
 from a2a.models.agent_card import AgentCard, AgentCapabilities
 from a2a.integrations.fastapi import add_a2a_routes
 
 
+def _mkid() -> str:
+    """Generate a random identifier (hex form skips UUID dash formatting)."""
+    return uuid.uuid4().hex
+
+
+# Hoisted so the message handler skips the enum attribute lookup per request
+_AGENT = MessageRole.AGENT
+
+
 # Create FastAPI app
 app = FastAPI(
     title="A2A Echo Agent",
@@ -15,8 +31,13 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Create task manager
-task_manager = TaskManager()
+# Create task manager. Set REDIS_URL to share tasks between worker processes;
+# otherwise each process keeps its own in-memory task store.
+redis_url = os.getenv("REDIS_URL")
+if redis_url:
+    task_manager = TaskManager(task_store=RedisTaskStore.from_url(redis_url))
+else:
+    task_manager = TaskManager()
 
 
 async def process_message(message: Message) -> Message:
@@ -29,23 +50,48 @@ async def process_message(message: Message) -> Message:
     Returns:
         Message: Echo response
     """
-    # Extract text from the message
-    text_parts = [part for part in message.parts if part.type == "text"]
-    if not text_parts:
+    # Extract the first text part without building an intermediate list
+    first_text = next((part.text for part in message.parts if part.type == "text"), None)
+    if first_text is None:
         response_text = "Echo: (No text content found)"
     else:
-        original_text = text_parts[0].text
-        response_text = f"Echo: {original_text}"
+        response_text = f"Echo: {first_text}"
     
     # Create response message
     return Message(
-        role=MessageRole.AGENT,
-        message_id=str(uuid.uuid4()),
+        role=_AGENT,
+        message_id=_mkid(),
         context_id=message.context_id,
         parts=[TextPart(text=response_text)]
     )
 
 
+# The card only varies by URL, so build it once and copy it per request. The
+# URL comes from the client's Host header, so copies are not cached by URL.
+_AGENT_CARD_TEMPLATE = AgentCard(
+    name="Echo Agent",
+    description="A simple agent that echoes messages back to the user",
+    url="",
+    version="1.0.0",
+    capabilities=AgentCapabilities(
+        streaming=True,
+        push_notifications=False,
+        state_transition_history=False
+    ),
+    default_input_modes=["text"],
+    default_output_modes=["text"],
+    skills=[]
+)
+
+# A given card URL always resolves to the same agent URL, so a digest of the
+# template identifies the card content. sha256 (not hash()) keeps the ETag
+# stable across worker processes.
+_CARD_PATH = "/echo/card"
+_CARD_DIGEST = hashlib.sha256(_AGENT_CARD_TEMPLATE.model_dump_json().encode()).hexdigest()
+_CARD_ETAG = f'"{_CARD_DIGEST[:32]}"'
+_CARD_CACHE_HEADERS = {"Cache-Control": "public, max-age=60", "ETag": _CARD_ETAG}
+
+
 async def get_agent_card(agent_url: str) -> AgentCard:
     """
     Return agent card with capabilities and metadata.
@@ -56,20 +102,7 @@ async def get_agent_card(agent_url: str) -> AgentCard:
     Returns:
         AgentCard: Agent capabilities and metadata
     """
-    return AgentCard(
-        name="Echo Agent",
-        description="A simple agent that echoes messages back to the user",
-        url=agent_url,
-        version="1.0.0",
-        capabilities=AgentCapabilities(
-            streaming=True,
-            push_notifications=False,
-            state_transition_history=False
-        ),
-        default_input_modes=["text"],
-        default_output_modes=["text"],
-        skills=[]
-    )
+    return _AGENT_CARD_TEMPLATE.model_copy(update={"url": agent_url})
 
 
 # Register handlers with task manager
@@ -79,37 +112,110 @@ task_manager.on_agent_card_query = get_agent_card
 # Add A2A routes to the FastAPI app
 add_a2a_routes(app, task_manager, "/echo")
 
+def _etag_matches(if_none_match: str) -> bool:
+    """Check an If-None-Match header against the card ETag (weak comparison)."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == _CARD_ETAG or tag == "*":
+            return True
+    return False
+
+
+class CardCacheMiddleware:
+    """
+    Let clients cache the agent card and revalidate it with If-None-Match.
+    
+    This is a plain ASGI middleware rather than @app.middleware("http"), so
+    requests for every other path, including the event streams, pass straight
+    through without being wrapped.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["path"] != _CARD_PATH
+            or scope["method"] not in ("GET", "HEAD")
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match):
+            response = Response(status_code=304, headers=_CARD_CACHE_HEADERS)
+            await response(scope, receive, send)
+            return
+        
+        async def send_with_cache_headers(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                MutableHeaders(raw=message["headers"]).update(_CARD_CACHE_HEADERS)
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cache_headers)
+
+
+app.add_middleware(CardCacheMiddleware)
+
+
+# Responses for the informational endpoints never change, so they are
+# serialized once at import time instead of on every request
+_ROOT_BYTES = json.dumps({
+    "name": "A2A Echo Agent",
+    "description": "A simple echo agent implementation",
+    "version": "1.0.0",
+    "agent_endpoint": "/echo",
+    "agent_card": "/echo/card"
+}, separators=(",", ":")).encode()
+_HEALTH_BYTES = json.dumps(
+    {"status": "healthy", "service": "a2a-echo-agent"}, separators=(",", ":")
+).encode()
+
+
 # Add a root endpoint for basic info
 @app.get("/")
 async def root():
     """Root endpoint with basic information."""
-    return {
-        "name": "A2A Echo Agent",
-        "description": "A simple echo agent implementation",
-        "version": "1.0.0",
-        "agent_endpoint": "/echo",
-        "agent_card": "/echo/card"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # Add health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "a2a-echo-agent"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
     
+    # Number of worker processes. Without REDIS_URL each worker has its own
+    # InMemoryTaskStore and tasks are not shared between workers, so keep the
+    # default of 1 unless REDIS_URL is set.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    
+    # Prefer the uvloop event loop and httptools parser when installed
+    # (pip install "pompompurin-a2a[speedups]"); uvloop is not available on Windows
+    use_uvloop = sys.platform != "win32" and find_spec("uvloop") is not None
+    loop = "uvloop" if use_uvloop else "asyncio"
+    http = "httptools" if find_spec("httptools") is not None else "h11"
+    
     print("Starting A2A Echo Agent...")
     print("Agent will be available at: http://localhost:8000/echo")
     print("Agent card: http://localhost:8000/echo/card")
     print("Health check: http://localhost:8000/health")
     
+    # The app is passed as an import string so uvicorn can spawn workers
     uvicorn.run(
-        app, 
+        "main:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
         host="0.0.0.0", 
         port=8000,
+        workers=workers,
+        loop=loop,
+        http=http,
         log_level="info"
     )
\ No newline at end of file
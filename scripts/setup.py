@@ -9,21 +9,24 @@ import subprocess
 import sys
 import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(command, description, check=True):
+def run_command(command, description, check=True, show_output=True):
     """Run a command and handle errors."""
     print(f"\n🔄 {description}...")
+    # Only capture stdout when it is going to be printed
+    stdout = subprocess.PIPE if show_output else subprocess.DEVNULL
     try:
         if isinstance(command, str):
-            result = subprocess.run(command, shell=True, check=check, capture_output=True, text=True)
+            result = subprocess.run(command, shell=True, check=check, stdout=stdout, stderr=subprocess.PIPE, text=True)
         else:
-            result = subprocess.run(command, check=check, capture_output=True, text=True)
+            result = subprocess.run(command, check=check, stdout=stdout, stderr=subprocess.PIPE, text=True)
         
         if result.returncode == 0:
             print(f"✅ {description} completed successfully")
-            if result.stdout.strip():
+            if result.stdout and result.stdout.strip():
                 print(f"   Output: {result.stdout.strip()}")
         else:
             print(f"❌ {description} failed")
@@ -83,14 +86,28 @@ def setup_development_environment():
     # Check code quality tools
     print("\n🔧 Checking development tools...")
     
-    tools_status = {
-        "black": run_command([sys.executable, "-m", "black", "--version"], "Checking Black", check=False),
-        "isort": run_command([sys.executable, "-m", "isort", "--version"], "Checking isort", check=False),
-        "ruff": run_command([sys.executable, "-m", "ruff", "--version"], "Checking Ruff", check=False),
-        "mypy": run_command([sys.executable, "-m", "mypy", "--version"], "Checking MyPy", check=False),
-        "pytest": run_command([sys.executable, "-m", "pytest", "--version"], "Checking pytest", check=False),
+    tool_checks = {
+        "black": "Black",
+        "isort": "isort",
+        "ruff": "Ruff",
+        "mypy": "MyPy",
+        "pytest": "pytest",
     }
     
+    # The checks are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(tool_checks)) as executor:
+        futures = {
+            tool: executor.submit(
+                run_command,
+                [sys.executable, "-m", tool, "--version"],
+                f"Checking {name}",
+                check=False,
+                show_output=False,
+            )
+            for tool, name in tool_checks.items()
+        }
+    tools_status = {tool: future.result() for tool, future in futures.items()}
+    
     print("\n📊 Development Tools Status:")
     for tool, status in tools_status.items():
         status_icon = "✅" if status else "❌"
@@ -170,27 +187,18 @@ def quick_test():
     """Run a quick test to verify everything works."""
     print("\n🧪 Running quick verification test...")
     
-    test_code = '''
-import asyncio
-from pompompurin_a2a import Message, MessageRole, TextPart, TaskManager
-
-async def test():
-    # Test basic functionality
-    message = Message(
-        role=MessageRole.USER,
-        parts=[TextPart(text="Hello PomPom!")]
-    )
-    
-    task_manager = TaskManager()
-    print(f"✅ Created message: {message.parts[0].text}")
-    print(f"✅ Created task manager: {type(task_manager).__name__}")
-    print("🍮 PomPom-A2A is working correctly!")
-
-asyncio.run(test())
-'''
-    
     try:
-        exec(test_code)
+        # Only the models are needed for a smoke test; the server stack is
+        # covered by the test suite
+        from a2a import Message, MessageRole, TextPart
+        
+        message = Message(
+            role=MessageRole.USER,
+            parts=[TextPart(text="Hello PomPom!")]
+        )
+        assert message.parts[0].text == "Hello PomPom!"
+        print(f"✅ Created message: {message.parts[0].text}")
+        print("🍮 PomPom-A2A is working correctly!")
         return True
     except Exception as e:
         print(f"❌ Quick test failed: {e}")
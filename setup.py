@@ -33,15 +33,15 @@ def main():
     
     print(f"✓ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     
-    # Install dependencies
-    if not run_command("pip install -r requirements.txt", "Installing dependencies"):
+    # Install dependencies and the package in development mode with a single
+    # pip run so the dependency graph is only resolved once
+    pip_command = (
+        f'"{sys.executable}" -m pip install --no-input --disable-pip-version-check '
+        "-r requirements.txt -e ."
+    )
+    if not run_command(pip_command, "Installing dependencies and package in development mode"):
         print("Failed to install dependencies. Please install manually:")
-        print("pip install -r requirements.txt")
-        sys.exit(1)
-    
-    # Install package in development mode
-    if not run_command("pip install -e .", "Installing package in development mode"):
-        print("Failed to install package in development mode")
+        print("pip install -r requirements.txt -e .")
         sys.exit(1)
     
     # Run tests
@@ -26,33 +26,71 @@ __email__ = "team@pompom-a2a.dev"
 __license__ = "Apache-2.0"
 __description__ = "🍮 PomPom-A2A: A delightfully simple Python SDK for the Agent2Agent (A2A) protocol"
 
-# Core models
-from .models.message import Message, MessageRole, TextPart, FilePart, DataPart, FileContent
-from .models.agent_card import (
-    AgentCard, 
-    AgentCapabilities, 
-    AgentSkill, 
-    AgentProvider,
-    AgentAuthentication
-)
-from .models.task import (
-    Task, 
-    TaskStatus, 
-    TaskState, 
-    TaskSendParams,
-    TaskQueryParams,
-    TaskStatusUpdateEvent,
-    TaskArtifactUpdateEvent,
-    Artifact
-)
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING, Any as _Any, List as _List
+
+# Models, client and server components are imported lazily on first attribute
+# access (PEP 562), so ``import a2a`` does not pull in pydantic, httpx or the
+# server stack until they are actually used.
+_LAZY_IMPORTS = {
+    # Core models
+    "Message": ".models.message",
+    "MessageRole": ".models.message",
+    "TextPart": ".models.message",
+    "FilePart": ".models.message",
+    "DataPart": ".models.message",
+    "FileContent": ".models.message",
+    "AgentCard": ".models.agent_card",
+    "AgentCapabilities": ".models.agent_card",
+    "AgentSkill": ".models.agent_card",
+    "AgentProvider": ".models.agent_card",
+    "AgentAuthentication": ".models.agent_card",
+    "Task": ".models.task",
+    "TaskStatus": ".models.task",
+    "TaskState": ".models.task",
+    "TaskSendParams": ".models.task",
+    "TaskQueryParams": ".models.task",
+    "TaskStatusUpdateEvent": ".models.task",
+    "TaskArtifactUpdateEvent": ".models.task",
+    "Artifact": ".models.task",
+    
+    # Client components
+    "A2AClient": ".client.a2a_client",
+    "A2ACardResolver": ".client.card_resolver",
+    
+    # Server components
+    "TaskManager": ".server.task_manager",
+    "TaskStore": ".server.task_store",
+    "InMemoryTaskStore": ".server.task_store",
+    "RedisTaskStore": ".server.task_store",
+}
 
-# Client components
-from .client.a2a_client import A2AClient
-from .client.card_resolver import A2ACardResolver
+# Subpackages, imported on first access as the eager imports once did
+_SUBPACKAGES = frozenset({"client", "models", "server", "integrations"})
 
-# Server components
-from .server.task_manager import TaskManager
-from .server.task_store import TaskStore, InMemoryTaskStore
+if _TYPE_CHECKING:
+    from .models.message import Message, MessageRole, TextPart, FilePart, DataPart, FileContent
+    from .models.agent_card import (
+        AgentCard, 
+        AgentCapabilities, 
+        AgentSkill, 
+        AgentProvider,
+        AgentAuthentication
+    )
+    from .models.task import (
+        Task, 
+        TaskStatus, 
+        TaskState, 
+        TaskSendParams,
+        TaskQueryParams,
+        TaskStatusUpdateEvent,
+        TaskArtifactUpdateEvent,
+        Artifact
+    )
+    from .client.a2a_client import A2AClient
+    from .client.card_resolver import A2ACardResolver
+    from .server.task_manager import TaskManager
+    from .server.task_store import TaskStore, InMemoryTaskStore, RedisTaskStore
 
 # Exceptions
 from .exceptions import (
@@ -70,7 +108,7 @@ from .exceptions import (
 )
 
 # Main exports
-__all__ = [
+__all__ = (
     # Core models
     "Message",
     "MessageRole", 
@@ -100,6 +138,7 @@ __all__ = [
     "TaskManager",
     "TaskStore",
     "InMemoryTaskStore",
+    "RedisTaskStore",
     
     # Exceptions
     "A2AException",
@@ -113,7 +152,29 @@ __all__ = [
     "MethodNotFoundException",
     "InvalidParamsException",
     "InternalErrorException",
-]
+)
+
+
+def __getattr__(name: str) -> _Any:
+    """Import lazily exported names and subpackages on first access."""
+    if name in _SUBPACKAGES:
+        # Importing a subpackage binds it as an attribute of this package
+        return _importlib.import_module(f".{name}", __name__)
+    
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(_importlib.import_module(module_name, __name__), name)
+    # Cache the value so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _List[str]:
+    """List module attributes, including lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBPACKAGES)
+
 
 # Package metadata
 __package_name__ = "pompompurin-a2a"
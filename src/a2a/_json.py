@@ -0,0 +1,29 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from datetime import date, datetime
+from typing import Any, Callable
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the non-JSON types found in model dumps for the stdlib encoder."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes with the stdlib encoder."""
+    return json.dumps(obj, separators=(",", ":"), default=_default).encode()
+
+
+dumps: Callable[[Any], bytes]
+loads: Callable[[Any], Any]
+try:
+    from orjson import dumps, loads
+except ImportError:
+    dumps = _stdlib_dumps
+    loads = json.loads
@@ -3,7 +3,7 @@
 from .a2a_client import A2AClient
 from .card_resolver import A2ACardResolver
 
-__all__ = [
+__all__ = (
     "A2AClient",
     "A2ACardResolver",
-]
\ No newline at end of file
+)
\ No newline at end of file
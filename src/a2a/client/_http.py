@@ -0,0 +1,110 @@
+"""HTTP client ownership shared by the A2A client and card resolver."""
+
+from typing import Any, Dict, Optional, Tuple
+import httpx
+
+
+# Connection pool limits shared by the A2A HTTP clients
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+
+
+def _create_http_client(
+    base_url: str,
+    timeout: float,
+    headers: Dict[str, str],
+    transport: Optional[httpx.AsyncBaseTransport] = None
+) -> httpx.AsyncClient:
+    """Create an httpx client for an A2A endpoint."""
+    # HTTP/2 lets concurrent requests share one connection; request paths
+    # are relative to base_url. A given transport brings its own pool.
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        headers=headers,
+        http2=True,
+        limits=_DEFAULT_LIMITS,
+        transport=transport
+    )
+
+
+class _SharedClient:
+    """A shared httpx client, its registry key and the number of handles holding it."""
+
+    __slots__ = ("client", "key", "refcount")
+
+    def __init__(self, client: httpx.AsyncClient, key: Tuple[Any, ...]):
+        self.client = client
+        self.key = key
+        self.refcount = 0
+
+
+# Shared httpx clients keyed by connection settings. Opening and releasing
+# never await while touching the registry, so they are atomic with respect
+# to other tasks on the event loop and need no lock.
+_CLIENT_REGISTRY: Dict[Tuple[Any, ...], _SharedClient] = {}
+
+
+class _HTTPClientHandle:
+    """The httpx client used by an A2A client, and whether closing it is ours to do."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        owned: bool = True,
+        shared: Optional[_SharedClient] = None
+    ):
+        self.client = client
+        self._owned = owned
+        self._shared = shared
+        self._closed = False
+
+    @classmethod
+    def open(
+        cls,
+        base_url: str,
+        timeout: float,
+        headers: Dict[str, str],
+        shared: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> "_HTTPClientHandle":
+        """Open a handle to an httpx client; see A2AClient for shared and transport."""
+        if not shared:
+            client = _create_http_client(base_url, timeout, headers, transport)
+            # A caller-provided transport outlives the handle, and closing
+            # the httpx client would close it too
+            return cls(client, owned=transport is None)
+        
+        if transport is not None:
+            raise ValueError("A shared client cannot use a custom transport")
+        
+        key = (base_url, timeout, frozenset(headers.items()))
+        entry = _CLIENT_REGISTRY.get(key)
+        if entry is None or entry.client.is_closed:
+            entry = _SharedClient(_create_http_client(base_url, timeout, headers), key)
+            _CLIENT_REGISTRY[key] = entry
+        entry.refcount += 1
+        return cls(entry.client, shared=entry)
+
+    async def aclose(self) -> None:
+        """Close the httpx client, or release it if it is shared."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        entry = self._shared
+        if entry is None:
+            if self._owned:
+                await self.client.aclose()
+            return
+        
+        # Release the entry this handle acquired; the registry may hold a
+        # replacement by now, whose holders must not be affected
+        entry.refcount -= 1
+        if entry.refcount <= 0:
+            if _CLIENT_REGISTRY.get(entry.key) is entry:
+                del _CLIENT_REGISTRY[entry.key]
+            await entry.client.aclose()
@@ -1,17 +1,170 @@
 """A2A protocol client implementation."""
 
-import json
-from typing import Optional, AsyncGenerator, Dict, Any
+import re
+from typing import Optional, AsyncGenerator, Dict, Any, Iterator, List, Type, TypeVar, cast
 import httpx
+from pydantic import BaseModel, ValidationError
+from .._json import loads as json_loads
+from ._http import _HTTPClientHandle
 from ..models.message import Message
 from ..models.agent_card import AgentCard
-from ..models.task import Task, TaskSendParams, TaskQueryParams
+from ..models.task import Task, TaskSendParams
 from ..exceptions import (
     A2AClientException, TaskNotFoundException, 
     InvalidRequestException, InternalErrorException
 )
 
 
+_ModelT = TypeVar("_ModelT", AgentCard, Message, Task)
+
+
+# Per-request headers, built once instead of on every call. They are
+# httpx.Headers so merging them into the client headers copies the already
+# normalized entries instead of re-encoding a dict on each request.
+_JSON_HEADERS = httpx.Headers({"Content-Type": "application/json"})
+_JSON_SSE_HEADERS = httpx.Headers({
+    "Content-Type": "application/json",
+    "Accept": "text/event-stream"
+})
+_SSE_HEADERS = httpx.Headers({"Accept": "text/event-stream"})
+
+_SSE_BOM = b"\xef\xbb\xbf"
+_SSE_DATA_FIELD = b"data:"
+# SSE lines end in CRLF, a lone LF or a lone CR
+_SSE_LINE_END = re.compile(rb"\r\n?|\n")
+
+
+class _SSEDecoder:
+    """Incremental decoder that extracts event data from a server-sent event stream."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._data = bytearray()
+        self._has_data = False
+        self._started = False
+        # Length of the buffered partial line already searched for a newline
+        self._scanned = 0
+        # The last chunk ended in a CR, so an LF starting the next one
+        # completes that line ending rather than ending a blank line
+        self._skip_lf = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add a chunk of the stream and return the data of each completed event."""
+        buffer = self._buffer
+        buffer += chunk
+        if not self._started:
+            # Wait until a possible byte order mark is fully buffered
+            if len(buffer) < len(_SSE_BOM) and _SSE_BOM.startswith(buffer):
+                return []
+            self._started = True
+            if buffer.startswith(_SSE_BOM):
+                del buffer[:len(_SSE_BOM)]
+        
+        if self._skip_lf and buffer:
+            if buffer[0] == 0x0A:
+                del buffer[0]
+            self._skip_lf = False
+        
+        events = []
+        data = self._data
+        start = 0
+        # Resume the search after the partial line scanned by earlier calls, so
+        # a large event arriving in many chunks is scanned once, not per chunk
+        search = self._scanned
+        find_line_end = _SSE_LINE_END.search
+        while True:
+            line_end = find_line_end(buffer, search)
+            if line_end is None:
+                break
+            
+            end = line_end.start()
+            if end == start:
+                # A blank line dispatches the event
+                if self._has_data:
+                    events.append(bytes(data))
+                    data.clear()
+                    self._has_data = False
+            elif buffer.startswith(_SSE_DATA_FIELD, start, end):
+                value_start = start + len(_SSE_DATA_FIELD)
+                if value_start < end and buffer[value_start] == 0x20:
+                    value_start += 1
+                if self._has_data:
+                    data += b"\n"
+                data += buffer[value_start:end]
+                self._has_data = True
+            
+            start = search = line_end.end()
+        
+        # A CR ending the buffer may be the first half of a CRLF
+        if start and start == len(buffer) and buffer[start - 1] == 0x0D:
+            self._skip_lf = True
+        
+        # Drop consumed lines with a single move of the remaining bytes
+        if start:
+            del buffer[:start]
+        self._scanned = len(buffer)
+        return events
+
+    def flush(self) -> List[bytes]:
+        """Return the data of an event left unterminated at the end of the stream."""
+        # Terminate a pending partial line, then the pending event
+        self._skip_lf = False
+        return self.feed(b"\n\n")
+
+
+def _decode_sse_events(events: List[bytes]) -> Iterator[Any]:
+    """Decode the JSON data of server-sent events, skipping invalid JSON."""
+    for data in events:
+        try:
+            payload = json_loads(data)
+        except ValueError:
+            continue
+        yield payload
+
+
+async def _iter_sse_data(response: httpx.Response) -> AsyncGenerator[Any, None]:
+    """Yield the decoded JSON data of each event in a server-sent event response."""
+    decoder = _SSEDecoder()
+    async for chunk in response.aiter_bytes():
+        for payload in _decode_sse_events(decoder.feed(chunk)):
+            yield payload
+    
+    for payload in _decode_sse_events(decoder.flush()):
+        yield payload
+
+
+def _history_params(history_length: Optional[int]) -> Optional[Dict[str, int]]:
+    """Build the query parameters for a history length limit, if one is set."""
+    # httpx accepts None, so no dict is allocated for the common unbounded case
+    return {"historyLength": history_length} if history_length is not None else None
+
+
+def _handle_response(response: httpx.Response, not_found_id: Optional[str] = None) -> None:
+    """Raise the matching A2A exception if the response is not successful."""
+    if response.is_success:
+        return
+    status = response.status_code
+    if status == 404 and not_found_id is not None:
+        raise TaskNotFoundException(not_found_id)
+    raise A2AClientException(f"HTTP error: {status}")
+
+
+def _dump_request(model: BaseModel) -> bytes:
+    """Serialize a request model to JSON bytes."""
+    # pydantic-core returns bytes, so httpx sends them without encoding a str
+    return model.__pydantic_serializer__.to_json(model)
+
+
+def _parse_response(model: Type[_ModelT], response: httpx.Response) -> _ModelT:
+    """Validate a response body as the given model."""
+    try:
+        # Call the compiled pydantic-core validator directly, skipping the
+        # model_validate_json wrapper on every response
+        return cast(_ModelT, model.__pydantic_validator__.validate_json(response.content))
+    except ValidationError as e:
+        raise A2AClientException(f"Invalid response format: {str(e)}")
+
+
 class A2AClient:
     """Client for communicating with A2A protocol agents."""
 
@@ -19,7 +172,9 @@ class A2AClient:
         self, 
         base_url: str, 
         timeout: float = 30.0,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        shared: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """
         Initialize A2A client.
@@ -28,14 +183,21 @@ class A2AClient:
             base_url: Base URL of the A2A agent
             timeout: Request timeout in seconds
             headers: Additional headers to include in requests
+            shared: Reuse one connection pool across clients created with the
+                same base URL, timeout and headers; it is closed when the last
+                of those clients is closed
+            transport: httpx transport to send requests through, such as
+                one AsyncHTTPTransport shared by several clients. The caller
+                owns it and must close it, e.g. in the application lifespan;
+                it cannot be combined with shared
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.headers = headers or {}
-        self.client = httpx.AsyncClient(
-            timeout=timeout,
-            headers=self.headers
+        self._http = _HTTPClientHandle.open(
+            self.base_url, timeout, self.headers, shared, transport
         )
+        self.client = self._http.client
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -46,8 +208,8 @@ class A2AClient:
         await self.close()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client, or release it if it is shared."""
+        await self._http.aclose()
 
     async def get_agent_card(self) -> AgentCard:
         """
@@ -60,15 +222,13 @@ class A2AClient:
             A2AClientException: If the request fails
         """
         try:
-            response = await self.client.get(f"{self.base_url}/card")
-            response.raise_for_status()
-            return AgentCard(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise A2AClientException(f"Failed to get agent card: {e.response.status_code}")
+            response = await self.client.get("/card")
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
+        
+        if not response.is_success:
+            raise A2AClientException(f"Failed to get agent card: {response.status_code}")
+        return _parse_response(AgentCard, response)
 
     async def send_message(self, message: Message) -> Message:
         """
@@ -85,23 +245,20 @@ class A2AClient:
         """
         try:
             response = await self.client.post(
-                f"{self.base_url}/message/send",
-                json=message.model_dump(),
-                headers={"Content-Type": "application/json"}
+                "/message/send",
+                content=_dump_request(message),
+                headers=_JSON_HEADERS
             )
-            response.raise_for_status()
-            return Message(**response.json())
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 400:
-                raise InvalidRequestException("Invalid message format")
-            elif e.response.status_code == 500:
-                raise InternalErrorException("Server error")
-            else:
-                raise A2AClientException(f"HTTP error: {e.response.status_code}")
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
+        
+        status = response.status_code
+        if status == 400:
+            raise InvalidRequestException("Invalid message format")
+        if status == 500:
+            raise InternalErrorException("Server error")
+        _handle_response(response)
+        return _parse_response(Message, response)
 
     async def send_message_stream(self, message: Message) -> AsyncGenerator[Dict[str, Any], None]:
         """
@@ -119,33 +276,17 @@ class A2AClient:
         try:
             async with self.client.stream(
                 "POST",
-                f"{self.base_url}/message/sendSubscribe",
-                json=message.model_dump(),
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "text/event-stream"
-                }
+                "/message/sendSubscribe",
+                content=_dump_request(message),
+                headers=_JSON_SSE_HEADERS
             ) as response:
-                response.raise_for_status()
+                _handle_response(response)
                 
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        try:
-                            data = json.loads(line[6:])
-                            yield data
-                        except json.JSONDecodeError:
-                            # Skip invalid JSON lines
-                            continue
-                    elif line.strip() == "":
-                        # Empty line, continue
-                        continue
+                async for data in _iter_sse_data(response):
+                    yield data
                         
-        except httpx.HTTPStatusError as e:
-            raise A2AClientException(f"HTTP error: {e.response.status_code}")
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
 
     async def create_task(self, params: TaskSendParams) -> Task:
         """
@@ -162,18 +303,15 @@ class A2AClient:
         """
         try:
             response = await self.client.post(
-                f"{self.base_url}/tasks",
-                json=params.model_dump(),
-                headers={"Content-Type": "application/json"}
+                "/tasks",
+                content=_dump_request(params),
+                headers=_JSON_HEADERS
             )
-            response.raise_for_status()
-            return Task(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise A2AClientException(f"HTTP error: {e.response.status_code}")
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
+        
+        _handle_response(response)
+        return _parse_response(Task, response)
 
     async def get_task(self, task_id: str, history_length: Optional[int] = None) -> Task:
         """
@@ -191,28 +329,15 @@ class A2AClient:
             A2AClientException: If the request fails
         """
         try:
-            params = {}
-            if history_length is not None:
-                params["historyLength"] = history_length
-                
             response = await self.client.get(
-                f"{self.base_url}/tasks/{task_id}",
-                params=params
+                f"/tasks/{task_id}",
+                params=_history_params(history_length)
             )
-            
-            if response.status_code == 404:
-                raise TaskNotFoundException(task_id)
-                
-            response.raise_for_status()
-            return Task(**response.json())
-        except TaskNotFoundException:
-            raise
-        except httpx.HTTPStatusError as e:
-            raise A2AClientException(f"HTTP error: {e.response.status_code}")
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
+        
+        _handle_response(response, task_id)
+        return _parse_response(Task, response)
 
     async def send_task_message(
         self, 
@@ -236,30 +361,17 @@ class A2AClient:
             A2AClientException: If the request fails
         """
         try:
-            query_params = {}
-            if history_length is not None:
-                query_params["historyLength"] = history_length
-                
             response = await self.client.post(
-                f"{self.base_url}/tasks/{task_id}/send",
-                json=params.model_dump(),
-                params=query_params,
-                headers={"Content-Type": "application/json"}
+                f"/tasks/{task_id}/send",
+                content=_dump_request(params),
+                params=_history_params(history_length),
+                headers=_JSON_HEADERS
             )
-            
-            if response.status_code == 404:
-                raise TaskNotFoundException(task_id)
-                
-            response.raise_for_status()
-            return Task(**response.json())
-        except TaskNotFoundException:
-            raise
-        except httpx.HTTPStatusError as e:
-            raise A2AClientException(f"HTTP error: {e.response.status_code}")
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
+        
+        _handle_response(response, task_id)
+        return _parse_response(Task, response)
 
     async def send_task_message_stream(
         self, 
@@ -283,41 +395,20 @@ class A2AClient:
             A2AClientException: If the request fails
         """
         try:
-            query_params = {}
-            if history_length is not None:
-                query_params["historyLength"] = history_length
-                
             async with self.client.stream(
                 "POST",
-                f"{self.base_url}/tasks/{task_id}/sendSubscribe",
-                json=params.model_dump(),
-                params=query_params,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "text/event-stream"
-                }
+                f"/tasks/{task_id}/sendSubscribe",
+                content=_dump_request(params),
+                params=_history_params(history_length),
+                headers=_JSON_SSE_HEADERS
             ) as response:
-                if response.status_code == 404:
-                    raise TaskNotFoundException(task_id)
-                    
-                response.raise_for_status()
+                _handle_response(response, task_id)
                 
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        try:
-                            data = json.loads(line[6:])
-                            yield data
-                        except json.JSONDecodeError:
-                            continue
-                            
-        except TaskNotFoundException:
-            raise
-        except httpx.HTTPStatusError as e:
-            raise A2AClientException(f"HTTP error: {e.response.status_code}")
+                async for data in _iter_sse_data(response):
+                    yield data
+                        
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
 
     async def cancel_task(self, task_id: str) -> Task:
         """
@@ -334,21 +425,12 @@ class A2AClient:
             A2AClientException: If the request fails
         """
         try:
-            response = await self.client.post(f"{self.base_url}/tasks/{task_id}/cancel")
-            
-            if response.status_code == 404:
-                raise TaskNotFoundException(task_id)
-                
-            response.raise_for_status()
-            return Task(**response.json())
-        except TaskNotFoundException:
-            raise
-        except httpx.HTTPStatusError as e:
-            raise A2AClientException(f"HTTP error: {e.response.status_code}")
+            response = await self.client.post(f"/tasks/{task_id}/cancel")
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
+        
+        _handle_response(response, task_id)
+        return _parse_response(Task, response)
 
     async def resubscribe_task(self, task_id: str) -> AsyncGenerator[Dict[str, Any], None]:
         """
@@ -367,27 +449,13 @@ class A2AClient:
         try:
             async with self.client.stream(
                 "POST",
-                f"{self.base_url}/tasks/{task_id}/resubscribe",
-                headers={"Accept": "text/event-stream"}
+                f"/tasks/{task_id}/resubscribe",
+                headers=_SSE_HEADERS
             ) as response:
-                if response.status_code == 404:
-                    raise TaskNotFoundException(task_id)
-                    
-                response.raise_for_status()
+                _handle_response(response, task_id)
                 
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        try:
-                            data = json.loads(line[6:])
-                            yield data
-                        except json.JSONDecodeError:
-                            continue
-                            
-        except TaskNotFoundException:
-            raise
-        except httpx.HTTPStatusError as e:
-            raise A2AClientException(f"HTTP error: {e.response.status_code}")
+                async for data in _iter_sse_data(response):
+                    yield data
+                        
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
\ No newline at end of file
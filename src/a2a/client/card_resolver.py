@@ -1,9 +1,17 @@
 """A2A agent card resolver for discovering agent capabilities."""
 
-from typing import Optional, Dict, Any
+import asyncio
+import time
+from typing import Optional, Dict, Any, Tuple
 import httpx
+from pydantic import ValidationError
 from ..models.agent_card import AgentCard
 from ..exceptions import A2AClientException
+from ._http import _HTTPClientHandle
+
+
+# Maximum number of agent card requests in flight during discovery
+_MAX_DISCOVERY_CONCURRENCY = 10
 
 
 class A2ACardResolver:
@@ -13,7 +21,10 @@ class A2ACardResolver:
         self, 
         base_url: str, 
         timeout: float = 30.0,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        shared: bool = False,
+        card_ttl: float = 300.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """
         Initialize card resolver.
@@ -22,14 +33,21 @@ class A2ACardResolver:
             base_url: Base URL to resolve agent cards from
             timeout: Request timeout in seconds
             headers: Additional headers to include in requests
+            shared: Reuse one connection pool, as for A2AClient
+            card_ttl: Seconds a fetched agent card is reused without a request;
+                after that it is revalidated with its ETag
+            transport: Caller-owned httpx transport, as for A2AClient
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.headers = headers or {}
-        self.client = httpx.AsyncClient(
-            timeout=timeout,
-            headers=self.headers
+        self._card_ttl = card_ttl
+        # agent_path -> (card, etag, fetched at monotonic time)
+        self._card_cache: Dict[str, Tuple[AgentCard, str, float]] = {}
+        self._http = _HTTPClientHandle.open(
+            self.base_url, timeout, self.headers, shared, transport
         )
+        self.client = self._http.client
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -40,8 +58,8 @@ class A2ACardResolver:
         await self.close()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client, or release it if it is shared."""
+        await self._http.aclose()
 
     async def get_agent_card(self, agent_path: str = "") -> AgentCard:
         """
@@ -56,25 +74,37 @@ class A2ACardResolver:
         Raises:
             A2AClientException: If the request fails or agent card is invalid
         """
+        cached = self._card_cache.get(agent_path)
+        now = time.monotonic()
+        if cached is not None and now - cached[2] < self._card_ttl:
+            return cached[0]
+        
+        # Revalidate a stale card so an unchanged one costs only headers
+        request_headers = None
+        if cached is not None and cached[1]:
+            request_headers = {"If-None-Match": cached[1]}
+        
         try:
-            url = f"{self.base_url}{agent_path}/card"
-            response = await self.client.get(url)
-            response.raise_for_status()
-            
-            card_data = response.json()
-            return AgentCard(**card_data)
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise A2AClientException(f"Agent card not found at {url}")
-            else:
-                raise A2AClientException(f"HTTP error {e.response.status_code} getting agent card")
+            response = await self.client.get(f"{agent_path}/card", headers=request_headers)
         except httpx.RequestError as e:
             raise A2AClientException(f"Request failed: {str(e)}")
-        except ValueError as e:
+        
+        status = response.status_code
+        if status == 304 and cached is not None:
+            self._card_cache[agent_path] = (cached[0], cached[1], now)
+            return cached[0]
+        if status == 404:
+            raise A2AClientException(f"Agent card not found at {self.base_url}{agent_path}/card")
+        if not response.is_success:
+            raise A2AClientException(f"HTTP error {status} getting agent card")
+        
+        try:
+            card = AgentCard.model_validate_json(response.content)
+        except ValidationError as e:
             raise A2AClientException(f"Invalid agent card format: {str(e)}")
-        except Exception as e:
-            raise A2AClientException(f"Unexpected error: {str(e)}")
+        
+        self._card_cache[agent_path] = (card, response.headers.get("etag", ""), now)
+        return card
 
     async def discover_agents(self, paths: Optional[list[str]] = None) -> Dict[str, AgentCard]:
         """
@@ -100,17 +130,24 @@ class A2ACardResolver:
                 "/agent"
             ]
         
-        discovered_agents = {}
+        semaphore = asyncio.Semaphore(_MAX_DISCOVERY_CONCURRENCY)
+        
+        async def probe(path: str) -> Optional[AgentCard]:
+            async with semaphore:
+                try:
+                    return await self.get_agent_card(path)
+                except A2AClientException:
+                    # Skip paths that don't have agents
+                    return None
         
-        for path in paths:
-            try:
-                agent_card = await self.get_agent_card(path)
-                discovered_agents[path] = agent_card
-            except A2AClientException:
-                # Skip paths that don't have agents
-                continue
+        # Probe all paths concurrently so one slow path does not delay the rest
+        agent_cards = await asyncio.gather(*(probe(path) for path in paths))
         
-        return discovered_agents
+        return {
+            path: agent_card
+            for path, agent_card in zip(paths, agent_cards)
+            if agent_card is not None
+        }
 
     async def validate_agent_endpoint(self, agent_path: str = "") -> bool:
         """
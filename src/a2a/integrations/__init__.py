@@ -1,7 +1,8 @@
 """A2A Framework Integrations package."""
 
-from .fastapi import add_a2a_routes
+from .fastapi import A2ARouter, add_a2a_routes
 
-__all__ = [
+__all__ = (
+    "A2ARouter",
     "add_a2a_routes",
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -1,9 +1,9 @@
 """FastAPI integration for A2A protocol."""
 
-import json
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
+from .._json import dumps as json_dumps, loads as json_loads, JSONDecodeError
 from ..server.task_manager import TaskManager
 from ..models.message import Message
 from ..models.task import TaskSendParams, TaskQueryParams
@@ -14,112 +14,165 @@ from ..exceptions import (
 )
 
 
-def add_a2a_routes(app: FastAPI, task_manager: TaskManager, prefix: str = ""):
-    """
-    Add A2A protocol routes to a FastAPI application.
-    
-    Args:
-        app: FastAPI application instance
-        task_manager: TaskManager instance to handle requests
-        prefix: URL prefix for the agent (e.g., "/echo")
-    """
-    
-    def handle_a2a_exception(e: Exception) -> HTTPException:
-        """Convert A2A exceptions to HTTP exceptions."""
-        if isinstance(e, TaskNotFoundException):
-            return HTTPException(status_code=404, detail=str(e))
-        elif isinstance(e, TaskNotCancelableException):
-            return HTTPException(status_code=400, detail=str(e))
-        elif isinstance(e, InvalidRequestException):
-            return HTTPException(status_code=400, detail=str(e))
-        elif isinstance(e, InternalErrorException):
-            return HTTPException(status_code=500, detail=str(e))
-        elif isinstance(e, A2AException):
-            return HTTPException(status_code=500, detail=str(e))
-        else:
+# Server-sent event framing and response headers, shared by every stream
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+}
+
+
+def _sse_error(e: Exception) -> bytes:
+    """Frame an exception as a server-sent error event."""
+    return _SSE_PREFIX + json_dumps({"error": str(e), "type": "error"}) + _SSE_SUFFIX
+
+
+# HTTP status for each A2A exception type
+_ERROR_STATUS: Dict[type, int] = {
+    TaskNotFoundException: 404,
+    TaskNotCancelableException: 400,
+    InvalidRequestException: 400,
+    InternalErrorException: 500,
+    A2AException: 500,
+}
+
+
+def handle_a2a_exception(e: Exception) -> HTTPException:
+    """Convert A2A exceptions to HTTP exceptions."""
+    status = _ERROR_STATUS.get(type(e))
+    if status is None:
+        if not isinstance(e, A2AException):
             return HTTPException(status_code=500, detail="Internal server error")
+        # Subclasses map like their nearest mapped base class
+        status = next(_ERROR_STATUS[cls] for cls in type(e).__mro__ if cls in _ERROR_STATUS)
+    return HTTPException(status_code=status, detail=str(e))
+
+
+class A2ARouter:
+    """A2A protocol route handlers for one agent, bound to its task manager."""
+
+    def __init__(self, task_manager: TaskManager, prefix: str = ""):
+        """
+        Initialize A2A router.
+        
+        Args:
+            task_manager: TaskManager instance to handle requests
+            prefix: URL prefix for the agent (e.g., "/echo")
+        """
+        self.task_manager = task_manager
+        self.prefix = prefix
+
+    def register(self, app: FastAPI):
+        """Register the A2A protocol routes on a FastAPI application."""
+        prefix = self.prefix
+        app.add_api_route(f"{prefix}/card", self.get_agent_card, methods=["GET"])
+        app.add_api_route(f"{prefix}/message/send", self.send_message, methods=["POST"])
+        app.add_api_route(
+            f"{prefix}/message/sendSubscribe", self.send_message_stream, methods=["POST"]
+        )
+        app.add_api_route(f"{prefix}/tasks", self.create_task, methods=["POST"])
+        app.add_api_route(f"{prefix}/tasks/{{task_id}}", self.get_task, methods=["GET"])
+        app.add_api_route(
+            f"{prefix}/tasks/{{task_id}}/send", self.send_task_message, methods=["POST"]
+        )
+        app.add_api_route(
+            f"{prefix}/tasks/{{task_id}}/sendSubscribe",
+            self.send_task_message_stream,
+            methods=["POST"]
+        )
+        app.add_api_route(
+            f"{prefix}/tasks/{{task_id}}/cancel", self.cancel_task, methods=["POST"]
+        )
+        app.add_api_route(
+            f"{prefix}/tasks/{{task_id}}/resubscribe", self.resubscribe_task, methods=["POST"]
+        )
+        
+        # Optional: Add push notification endpoints (placeholder for future implementation)
+        push_path = f"{prefix}/tasks/{{task_id}}/pushNotification"
+        app.add_api_route(push_path, self.get_push_notification_config, methods=["GET"])
+        app.add_api_route(push_path, self.set_push_notification_config, methods=["PUT"])
+        app.add_api_route(push_path, self.delete_push_notification_config, methods=["DELETE"])
 
-    @app.get(f"{prefix}/card")
-    async def get_agent_card(request: Request):
+    async def get_agent_card(self, request: Request):
         """Get agent card information."""
         try:
             # Construct the agent URL from the request
-            agent_url = f"{request.url.scheme}://{request.url.netloc}{prefix}"
-            card = await task_manager.get_agent_card(agent_url)
+            agent_url = f"{request.url.scheme}://{request.url.netloc}{self.prefix}"
+            card = await self.task_manager.get_agent_card(agent_url)
             return card.model_dump()
         except Exception as e:
             raise handle_a2a_exception(e)
 
-    @app.post(f"{prefix}/message/send")
-    async def send_message(message: Message):
+    async def send_message(self, message: Message):
         """Send a message and get immediate response."""
         try:
-            response = await task_manager.process_message(message)
+            response = await self.task_manager.process_message(message)
             return response.model_dump()
         except Exception as e:
             raise handle_a2a_exception(e)
 
-    @app.post(f"{prefix}/message/sendSubscribe")
-    async def send_message_stream(message: Message):
+    async def send_message_stream(self, message: Message):
         """Send a message and stream the response."""
+        task_manager = self.task_manager
+
         async def event_stream():
             try:
                 response = await task_manager.process_message(message)
-                # For simple message processing, just return the response
-                yield f"data: {response.model_dump_json()}\n\n"
+                # For simple message processing, just return the response,
+                # serialized straight to bytes by pydantic-core
+                payload = response.__pydantic_serializer__.to_json(response)
+                yield _SSE_PREFIX + payload + _SSE_SUFFIX
             except Exception as e:
-                error_data = {
-                    "error": str(e),
-                    "type": "error"
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
+                yield _sse_error(e)
         
         return StreamingResponse(
-            event_stream(), 
+            event_stream(),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-            }
+            headers=_SSE_HEADERS
         )
 
-    @app.post(f"{prefix}/tasks")
-    async def create_task(params: TaskSendParams):
+    async def create_task(self, params: TaskSendParams):
         """Create a new task."""
         try:
-            task = await task_manager.create_task(params)
+            task = await self.task_manager.create_task(params)
             return task.model_dump()
         except Exception as e:
             raise handle_a2a_exception(e)
 
-    @app.get(f"{prefix}/tasks/{{task_id}}")
     async def get_task(
-        task_id: str, 
+        self,
+        task_id: str,
         historyLength: int = None,
         metadata: str = None
     ):
         """Get a task by ID."""
         try:
-            # Parse metadata if provided
-            parsed_metadata = None
             if metadata:
                 try:
-                    parsed_metadata = json.loads(metadata)
-                except json.JSONDecodeError:
+                    parsed_metadata = json_loads(metadata)
+                except JSONDecodeError:
                     raise InvalidRequestException("Invalid metadata JSON")
-            
-            params = TaskQueryParams(
-                id=task_id,
-                history_length=historyLength,
-                metadata=parsed_metadata
-            )
-            task = await task_manager.get_task(params)
+                
+                params = TaskQueryParams(
+                    id=task_id,
+                    history_length=historyLength,
+                    metadata=parsed_metadata
+                )
+            else:
+                # FastAPI has already validated the path and query values, so
+                # the common fetch-by-id case skips model validation
+                params = TaskQueryParams.model_construct(
+                    id=task_id,
+                    history_length=historyLength
+                )
+            task = await self.task_manager.get_task(params)
             return task.model_dump()
         except Exception as e:
             raise handle_a2a_exception(e)
 
-    @app.post(f"{prefix}/tasks/{{task_id}}/send")
     async def send_task_message(
+        self,
         task_id: str,
         params: TaskSendParams,
         historyLength: int = None,
@@ -127,88 +180,79 @@ def add_a2a_routes(app: FastAPI, task_manager: TaskManager, prefix: str = ""):
     ):
         """Send a message to an existing task."""
         try:
-            task = await task_manager.send_task_message(task_id, params)
-            
-            # Apply history length limit if specified
-            if historyLength is not None and task.history:
-                task.history = task.history[-historyLength:]
-            
+            # The task manager trims the history before it is serialized
+            task = await self.task_manager.send_task_message(
+                task_id, params, history_length=historyLength
+            )
             return task.model_dump()
         except Exception as e:
             raise handle_a2a_exception(e)
 
-    @app.post(f"{prefix}/tasks/{{task_id}}/sendSubscribe")
     async def send_task_message_stream(
+        self,
         task_id: str,
         params: TaskSendParams,
         historyLength: int = None,
         metadata: str = None
     ):
         """Send a message to a task and stream the response."""
-        async def event_stream():
-            try:
-                async for event in task_manager.send_task_message_stream(task_id, params):
-                    yield f"data: {json.dumps(event['data'])}\n\n"
-            except Exception as e:
-                error_data = {
-                    "error": str(e),
-                    "type": "error"
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
-        
         return StreamingResponse(
-            event_stream(),
+            self._event_stream(self.task_manager.send_task_message_stream(task_id, params)),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-            }
+            headers=_SSE_HEADERS
         )
 
-    @app.post(f"{prefix}/tasks/{{task_id}}/cancel")
-    async def cancel_task(task_id: str):
+    async def cancel_task(self, task_id: str):
         """Cancel a task."""
         try:
-            task = await task_manager.cancel_task(task_id)
+            task = await self.task_manager.cancel_task(task_id)
             return task.model_dump()
         except Exception as e:
             raise handle_a2a_exception(e)
 
-    @app.post(f"{prefix}/tasks/{{task_id}}/resubscribe")
-    async def resubscribe_task(task_id: str):
+    async def resubscribe_task(self, task_id: str):
         """Resubscribe to task updates."""
-        async def event_stream():
-            try:
-                async for event in task_manager.resubscribe_task(task_id):
-                    yield f"data: {json.dumps(event['data'])}\n\n"
-            except Exception as e:
-                error_data = {
-                    "error": str(e),
-                    "type": "error"
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
-        
         return StreamingResponse(
-            event_stream(),
+            self._event_stream(self.task_manager.resubscribe_task(task_id)),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-            }
+            headers=_SSE_HEADERS
         )
 
-    # Optional: Add push notification endpoints (placeholder for future implementation)
-    @app.get(f"{prefix}/tasks/{{task_id}}/pushNotification")
-    async def get_push_notification_config(task_id: str):
+    async def get_push_notification_config(self, task_id: str):
         """Get push notification configuration for a task."""
         raise HTTPException(status_code=501, detail="Push notifications not implemented")
 
-    @app.put(f"{prefix}/tasks/{{task_id}}/pushNotification")
-    async def set_push_notification_config(task_id: str, config: Dict[str, Any]):
+    async def set_push_notification_config(self, task_id: str, config: Dict[str, Any]):
         """Set push notification configuration for a task."""
         raise HTTPException(status_code=501, detail="Push notifications not implemented")
 
-    @app.delete(f"{prefix}/tasks/{{task_id}}/pushNotification")
-    async def delete_push_notification_config(task_id: str):
+    async def delete_push_notification_config(self, task_id: str):
         """Delete push notification configuration for a task."""
-        raise HTTPException(status_code=501, detail="Push notifications not implemented")
\ No newline at end of file
+        raise HTTPException(status_code=501, detail="Push notifications not implemented")
+
+    @staticmethod
+    async def _event_stream(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+        """Frame task manager events as server-sent events."""
+        dumps = json_dumps
+        try:
+            async for event in events:
+                yield _SSE_PREFIX + dumps(event['data']) + _SSE_SUFFIX
+        except Exception as e:
+            yield _sse_error(e)
+
+
+def add_a2a_routes(app: FastAPI, task_manager: TaskManager, prefix: str = "") -> A2ARouter:
+    """
+    Add A2A protocol routes to a FastAPI application.
+    
+    Args:
+        app: FastAPI application instance
+        task_manager: TaskManager instance to handle requests
+        prefix: URL prefix for the agent (e.g., "/echo")
+    
+    Returns:
+        A2ARouter: The router whose handlers were registered
+    """
+    router = A2ARouter(task_manager, prefix)
+    router.register(app)
+    return router
@@ -4,7 +4,7 @@ from .message import Message, MessageRole, TextPart, FilePart, DataPart
 from .agent_card import AgentCard, AgentCapabilities, AgentSkill, AgentProvider
 from .task import Task, TaskStatus, TaskState, Artifact
 
-__all__ = [
+__all__ = (
     "Message",
     "MessageRole",
     "TextPart", 
@@ -18,4 +18,4 @@ __all__ = [
     "TaskStatus",
     "TaskState",
     "Artifact",
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Agent card models for A2A protocol."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentCapabilities(BaseModel):
@@ -10,18 +10,24 @@ class AgentCapabilities(BaseModel):
     push_notifications: bool = Field(default=False, description="Supports push notifications")
     state_transition_history: bool = Field(default=False, description="Supports state transition history")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class AgentProvider(BaseModel):
     """Agent provider information."""
     organization: str = Field(description="Organization name")
     url: Optional[str] = Field(default=None, description="Organization URL")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class AgentAuthentication(BaseModel):
     """Agent authentication configuration."""
     schemes: List[str] = Field(description="Supported authentication schemes")
     credentials: Optional[str] = Field(default=None, description="Authentication credentials")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class AgentSkill(BaseModel):
     """Agent skill definition."""
@@ -33,6 +39,8 @@ class AgentSkill(BaseModel):
     input_modes: Optional[List[str]] = Field(default=None, description="Supported input modes")
     output_modes: Optional[List[str]] = Field(default=None, description="Supported output modes")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class AgentCard(BaseModel):
     """Agent card containing metadata and capabilities."""
@@ -44,6 +52,10 @@ class AgentCard(BaseModel):
     documentation_url: Optional[str] = Field(default=None, description="Documentation URL")
     capabilities: AgentCapabilities = Field(description="Agent capabilities")
     authentication: Optional[AgentAuthentication] = Field(default=None, description="Authentication info")
-    default_input_modes: List[str] = Field(default=["text"], description="Default input modes")
-    default_output_modes: List[str] = Field(default=["text"], description="Default output modes")
-    skills: List[AgentSkill] = Field(default=[], description="Agent skills")
\ No newline at end of file
+    default_input_modes: List[str] = Field(default_factory=lambda: ["text"], description="Default input modes")
+    default_output_modes: List[str] = Field(default_factory=lambda: ["text"], description="Default output modes")
+    skills: List[AgentSkill] = Field(default_factory=list, description="Agent skills")
+
+    # Cards are shared by the resolver cache and agent-side card caches, so
+    # they are immutable; use model_copy(update=...) to derive a variant
+    model_config = ConfigDict(frozen=True)
\ No newline at end of file
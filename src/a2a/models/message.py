@@ -1,7 +1,8 @@
 """Message models for A2A protocol."""
 
-from typing import List, Optional, Union, Any, Dict
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional, Union, Any, Dict
+from typing_extensions import Annotated
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
 from enum import Enum
 
 
@@ -13,7 +14,7 @@ class MessageRole(str, Enum):
 
 class TextPart(BaseModel):
     """Text content part of a message."""
-    type: str = Field(default="text", description="Type of the part")
+    type: Literal["text"] = Field(default="text", description="Type of the part")
     text: str = Field(description="Text content")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
@@ -28,20 +29,41 @@ class FileContent(BaseModel):
 
 class FilePart(BaseModel):
     """File content part of a message."""
-    type: str = Field(default="file", description="Type of the part")
+    type: Literal["file"] = Field(default="file", description="Type of the part")
     file: FileContent = Field(description="File content")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
 
 class DataPart(BaseModel):
     """Data content part of a message."""
-    type: str = Field(default="data", description="Type of the part")
+    type: Literal["data"] = Field(default="data", description="Type of the part")
     data: Dict[str, Any] = Field(description="Data content")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
 
-# Union type for all part types
-Part = Union[TextPart, FilePart, DataPart]
+def _part_type(value: Any) -> Optional[str]:
+    """Get the type tag of a part, inferring it for input that omits it."""
+    if isinstance(value, dict):
+        part_type = value.get("type")
+        if part_type is None:
+            # The type field has a default, so infer it from the content field
+            for content_field in ("text", "file", "data"):
+                if content_field in value:
+                    return content_field
+        return part_type
+    return getattr(value, "type", None)
+
+
+# Union type for all part types, dispatched on the type tag so each part is
+# validated against one model instead of trying every member
+Part = Annotated[
+    Union[
+        Annotated[TextPart, Tag("text")],
+        Annotated[FilePart, Tag("file")],
+        Annotated[DataPart, Tag("data")],
+    ],
+    Discriminator(_part_type)
+]
 
 
 class Message(BaseModel):
@@ -52,6 +74,4 @@ class Message(BaseModel):
     context_id: Optional[str] = Field(default=None, description="Context identifier for conversation")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
\ No newline at end of file
+    model_config = ConfigDict(use_enum_values=True)
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Task models for A2A protocol."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime, timezone
 from enum import Enum
 from .message import Message, Part
@@ -23,12 +23,6 @@ class TaskStatus(BaseModel):
     state: TaskState = Field(description="Current task state")
     message: Optional[Message] = Field(default=None, description="Status message")
     timestamp: datetime = Field(description="Status timestamp")
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class Artifact(BaseModel):
@@ -51,9 +45,7 @@ class Task(BaseModel):
     history: Optional[List[Message]] = Field(default=None, description="Task message history")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class TaskSendParams(BaseModel):
@@ -69,6 +61,8 @@ class TaskQueryParams(BaseModel):
     history_length: Optional[int] = Field(default=None, description="Length of history to retrieve")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class TaskStatusUpdateEvent(BaseModel):
     """Task status update event for streaming."""
@@ -82,4 +76,6 @@ class TaskArtifactUpdateEvent(BaseModel):
     """Task artifact update event for streaming."""
     id: str = Field(description="Task identifier")
     artifact: Artifact = Field(description="Updated artifact")
-    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
\ No newline at end of file
+    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
+
+    model_config = ConfigDict(defer_build=True)
\ No newline at end of file
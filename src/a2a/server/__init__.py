@@ -1,10 +1,11 @@
 """A2A Server package."""
 
 from .task_manager import TaskManager
-from .task_store import TaskStore, InMemoryTaskStore
+from .task_store import TaskStore, InMemoryTaskStore, RedisTaskStore
 
-__all__ = [
+__all__ = (
     "TaskManager",
     "TaskStore", 
     "InMemoryTaskStore",
-]
\ No newline at end of file
+    "RedisTaskStore",
+)
\ No newline at end of file
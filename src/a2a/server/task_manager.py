@@ -1,13 +1,13 @@
 """Task manager for handling A2A protocol operations."""
 
-import uuid
+import os
 from datetime import datetime, timezone
 from typing import Callable, Optional, AsyncGenerator, Dict, Any
 from ..models.message import Message
 from ..models.agent_card import AgentCard
 from ..models.task import (
     Task, TaskStatus, TaskState, TaskSendParams, TaskQueryParams,
-    TaskStatusUpdateEvent, TaskArtifactUpdateEvent
+    TaskArtifactUpdateEvent
 )
 from ..exceptions import (
     TaskNotFoundException, TaskNotCancelableException,
@@ -16,6 +16,46 @@ from ..exceptions import (
 from .task_store import TaskStore, InMemoryTaskStore
 
 
+# States a task cannot leave. TaskState is a str enum, so plain string
+# values match too.
+_TERMINAL_STATES = frozenset({TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED})
+
+
+def _new_status(state: TaskState, message: Optional[Message] = None) -> TaskStatus:
+    """Build a task status stamped with the current UTC time."""
+    # All values are server-generated, so skip validation
+    return TaskStatus.model_construct(
+        state=state,
+        message=message,
+        timestamp=datetime.now(timezone.utc)
+    )
+
+
+def _status_update(task_id: str, status: TaskStatus, final: bool = False) -> Dict[str, Any]:
+    """Build a streamed status update event for a task."""
+    # Build the TaskStatusUpdateEvent payload directly; only the nested
+    # status needs a model dump, so no event model is created per update
+    return {
+        "type": "status_update",
+        "data": {
+            "id": task_id,
+            "status": status.model_dump(),
+            "final": final,
+            "metadata": None
+        }
+    }
+
+
+def _limit_history(task: Task, history_length: Optional[int]) -> Task:
+    """Return the task with at most ``history_length`` of its latest history items."""
+    if history_length is None or not task.history or len(task.history) <= history_length:
+        return task
+    
+    # Trim a shallow copy so the stored task keeps its full history
+    start = max(len(task.history) - history_length, 0)
+    return task.model_copy(update={"history": task.history[start:]})
+
+
 class TaskManager:
     """Manages A2A protocol tasks and message handling."""
 
@@ -51,16 +91,20 @@ class TaskManager:
 
     async def create_task(self, params: TaskSendParams) -> Task:
         """Create a new task."""
-        task_id = str(uuid.uuid4())
+        # Task ids are opaque, so 128 random bits in hex are enough; this
+        # skips building and formatting a UUID object
+        task_id = os.urandom(16).hex()
+        
+        # Without a creation handler nothing observes the submitted state,
+        # so the task is stored as working directly, saving a store write
+        notify_created = self.on_task_created is not None
         
-        # Create initial task
-        task = Task(
+        # Create initial task; params were validated on the way in and the
+        # rest is server-generated, so skip validation
+        task = Task.model_construct(
             id=task_id,
             session_id=params.session_id,
-            status=TaskStatus(
-                state=TaskState.SUBMITTED,
-                timestamp=datetime.utcnow()
-            ),
+            status=_new_status(TaskState.SUBMITTED if notify_created else TaskState.WORKING),
             history=[params.message],
             metadata={}
         )
@@ -69,17 +113,15 @@ class TaskManager:
         await self.task_store.create_task(task)
         
         # Notify handler
-        if self.on_task_created:
+        if self.on_task_created is not None:
             await self.on_task_created(task)
         
         # Process the initial message
         try:
-            # Update task state to working
-            task.status = TaskStatus(
-                state=TaskState.WORKING,
-                timestamp=datetime.utcnow()
-            )
-            await self.task_store.update_task(task)
+            if notify_created:
+                # Update task state to working
+                task.status = _new_status(TaskState.WORKING)
+                await self.task_store.update_task(task)
             
             # Process the message
             if self.on_message_received:
@@ -89,11 +131,7 @@ class TaskManager:
                 task.history.append(response)
                 
                 # Update task state to completed
-                task.status = TaskStatus(
-                    state=TaskState.COMPLETED,
-                    message=response,
-                    timestamp=datetime.utcnow()
-                )
+                task.status = _new_status(TaskState.COMPLETED, response)
                 await self.task_store.update_task(task)
                 
                 if self.on_task_updated:
@@ -101,10 +139,7 @@ class TaskManager:
             
         except Exception as e:
             # Update task state to failed
-            task.status = TaskStatus(
-                state=TaskState.FAILED,
-                timestamp=datetime.utcnow()
-            )
+            task.status = _new_status(TaskState.FAILED)
             await self.task_store.update_task(task)
             raise InternalErrorException(f"Error processing task: {str(e)}")
         
@@ -115,12 +150,14 @@ class TaskManager:
         task = await self.task_store.get_task(params.id)
         
         # Apply history length limit if specified
-        if params.history_length is not None and task.history:
-            task.history = task.history[-params.history_length:]
-        
-        return task
+        return _limit_history(task, params.history_length)
 
-    async def send_task_message(self, task_id: str, params: TaskSendParams) -> Task:
+    async def send_task_message(
+        self, 
+        task_id: str, 
+        params: TaskSendParams,
+        history_length: Optional[int] = None
+    ) -> Task:
         """Send a message to an existing task."""
         task = await self.task_store.get_task(task_id)
         
@@ -129,42 +166,35 @@ class TaskManager:
             task.history = []
         task.history.append(params.message)
         
-        # Update task state to working
-        task.status = TaskStatus(
-            state=TaskState.WORKING,
-            timestamp=datetime.utcnow()
-        )
-        await self.task_store.update_task(task)
+        # Update task state to working. It is persisted together with the
+        # outcome, saving a store round trip per message; use the streaming
+        # variant when observers need to see the working state.
+        task.status = _new_status(TaskState.WORKING)
+        if not self.on_message_received:
+            await self.task_store.update_task(task)
+            return _limit_history(task, history_length)
         
         try:
             # Process the message
-            if self.on_message_received:
-                response = await self.on_message_received(params.message)
-                
-                # Add response to history
-                task.history.append(response)
-                
-                # Update task state to completed
-                task.status = TaskStatus(
-                    state=TaskState.COMPLETED,
-                    message=response,
-                    timestamp=datetime.utcnow()
-                )
-                await self.task_store.update_task(task)
-                
-                if self.on_task_updated:
-                    await self.on_task_updated(task)
+            response = await self.on_message_received(params.message)
+            
+            # Add response to history
+            task.history.append(response)
+            
+            # Update task state to completed
+            task.status = _new_status(TaskState.COMPLETED, response)
+            await self.task_store.update_task(task)
+            
+            if self.on_task_updated:
+                await self.on_task_updated(task)
             
         except Exception as e:
             # Update task state to failed
-            task.status = TaskStatus(
-                state=TaskState.FAILED,
-                timestamp=datetime.utcnow()
-            )
+            task.status = _new_status(TaskState.FAILED)
             await self.task_store.update_task(task)
             raise InternalErrorException(f"Error processing task message: {str(e)}")
         
-        return task
+        return _limit_history(task, history_length)
 
     async def send_task_message_stream(
         self, 
@@ -180,20 +210,11 @@ class TaskManager:
         task.history.append(params.message)
         
         # Update task state to working
-        task.status = TaskStatus(
-            state=TaskState.WORKING,
-            timestamp=datetime.utcnow()
-        )
+        task.status = _new_status(TaskState.WORKING)
         await self.task_store.update_task(task)
         
         # Yield status update
-        yield {
-            "type": "status_update",
-            "data": TaskStatusUpdateEvent(
-                id=task_id,
-                status=task.status
-            ).model_dump()
-        }
+        yield _status_update(task_id, task.status)
         
         try:
             # Process the message
@@ -204,43 +225,22 @@ class TaskManager:
                 task.history.append(response)
                 
                 # Update task state to completed
-                task.status = TaskStatus(
-                    state=TaskState.COMPLETED,
-                    message=response,
-                    timestamp=datetime.utcnow()
-                )
+                task.status = _new_status(TaskState.COMPLETED, response)
                 await self.task_store.update_task(task)
                 
                 # Yield final status update
-                yield {
-                    "type": "status_update",
-                    "data": TaskStatusUpdateEvent(
-                        id=task_id,
-                        status=task.status,
-                        final=True
-                    ).model_dump()
-                }
+                yield _status_update(task_id, task.status, final=True)
                 
                 if self.on_task_updated:
                     await self.on_task_updated(task)
             
         except Exception as e:
             # Update task state to failed
-            task.status = TaskStatus(
-                state=TaskState.FAILED,
-                timestamp=datetime.utcnow()
-            )
+            task.status = _new_status(TaskState.FAILED)
             await self.task_store.update_task(task)
             
             # Yield error status
-            yield {
-                "type": "status_update",
-                "data": TaskStatusUpdateEvent(
-                    id=task_id,
-                    status=task.status,
-                    final=True
-                ).model_dump()
-            }
+            yield _status_update(task_id, task.status, final=True)
             
             raise InternalErrorException(f"Error processing task message: {str(e)}")
 
@@ -249,14 +249,11 @@ class TaskManager:
         task = await self.task_store.get_task(task_id)
         
         # Check if task can be canceled
-        if task.status.state in [TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED]:
+        if task.status.state in _TERMINAL_STATES:
             raise TaskNotCancelableException(task_id)
         
         # Update task state to canceled
-        task.status = TaskStatus(
-            state=TaskState.CANCELED,
-            timestamp=datetime.utcnow()
-        )
+        task.status = _new_status(TaskState.CANCELED)
         await self.task_store.update_task(task)
         
         if self.on_task_canceled:
@@ -269,11 +266,8 @@ class TaskManager:
         task = await self.task_store.get_task(task_id)
         
         # Yield current status
-        yield {
-            "type": "status_update",
-            "data": TaskStatusUpdateEvent(
-                id=task_id,
-                status=task.status,
-                final=task.status.state in [TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED]
-            ).model_dump()
-        }
\ No newline at end of file
+        yield _status_update(
+            task_id,
+            task.status,
+            final=task.status.state in _TERMINAL_STATES
+        )
\ No newline at end of file
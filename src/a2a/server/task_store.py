@@ -1,7 +1,8 @@
 """Task storage interfaces and implementations."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List
+from .._json import loads as json_loads
 from ..models.task import Task
 from ..exceptions import TaskNotFoundException
 
@@ -45,21 +46,44 @@ class InMemoryTaskStore(TaskStore):
 
     def __init__(self):
         self._tasks: Dict[str, Task] = {}
+        # session_id -> task ids in insertion order (a dict used as an
+        # ordered set), plus the session each task is indexed under
+        self._session_tasks: Dict[str, Dict[str, None]] = {}
+        self._task_sessions: Dict[str, str] = {}
+
+    def _index_session(self, task_id: str, session_id: Optional[str]) -> None:
+        """Record a task under its session."""
+        if session_id is not None:
+            self._session_tasks.setdefault(session_id, {})[task_id] = None
+            self._task_sessions[task_id] = session_id
+
+    def _unindex_session(self, task_id: str) -> None:
+        """Remove a task from the session it is indexed under."""
+        session_id = self._task_sessions.pop(task_id, None)
+        if session_id is None:
+            return
+        
+        task_ids = self._session_tasks[session_id]
+        del task_ids[task_id]
+        if not task_ids:
+            del self._session_tasks[session_id]
 
     async def create_task(self, task: Task) -> Task:
         """Create a new task."""
-        if task.id in self._tasks:
+        # setdefault checks and inserts with a single lookup
+        if self._tasks.setdefault(task.id, task) is not task:
             raise ValueError(f"Task with ID {task.id} already exists")
         
-        self._tasks[task.id] = task
+        self._index_session(task.id, task.session_id)
         return task
 
     async def get_task(self, task_id: str) -> Task:
         """Get a task by ID."""
-        if task_id not in self._tasks:
+        task = self._tasks.get(task_id)
+        if task is None:
             raise TaskNotFoundException(task_id)
         
-        return self._tasks[task_id]
+        return task
 
     async def update_task(self, task: Task) -> Task:
         """Update an existing task."""
@@ -67,24 +91,27 @@ class InMemoryTaskStore(TaskStore):
             raise TaskNotFoundException(task.id)
         
         self._tasks[task.id] = task
+        if self._task_sessions.get(task.id) != task.session_id:
+            self._unindex_session(task.id)
+            self._index_session(task.id, task.session_id)
         return task
 
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task by ID."""
-        if task_id not in self._tasks:
+        if self._tasks.pop(task_id, None) is None:
             return False
         
-        del self._tasks[task_id]
+        self._unindex_session(task_id)
         return True
 
     async def list_tasks(self, session_id: Optional[str] = None) -> List[Task]:
         """List tasks, optionally filtered by session ID."""
-        tasks = list(self._tasks.values())
-        
-        if session_id is not None:
-            tasks = [task for task in tasks if task.session_id == session_id]
+        if session_id is None:
+            return list(self._tasks.values())
         
-        return tasks
+        # Look up the session's tasks instead of scanning the whole store
+        tasks = self._tasks
+        return [tasks[task_id] for task_id in self._session_tasks.get(session_id, ())]
 
     async def task_exists(self, task_id: str) -> bool:
         """Check if a task exists."""
@@ -93,7 +120,141 @@ class InMemoryTaskStore(TaskStore):
     def clear(self) -> None:
         """Clear all tasks (useful for testing)."""
         self._tasks.clear()
+        self._session_tasks.clear()
+        self._task_sessions.clear()
 
     def size(self) -> int:
         """Get the number of stored tasks."""
-        return len(self._tasks)
\ No newline at end of file
+        return len(self._tasks)
+
+
+class RedisTaskStore(TaskStore):
+    """
+    Redis-backed implementation of TaskStore.
+    
+    Tasks are stored as JSON under ``<prefix>task:<id>`` with set-based
+    indexes for listing, so every worker process of an agent sees the same
+    tasks. Requires the optional ``redis`` package (``redis.asyncio``).
+    """
+
+    def __init__(self, redis: Any, key_prefix: str = "a2a:"):
+        """
+        Initialize Redis task store.
+        
+        Args:
+            redis: A ``redis.asyncio.Redis`` client
+            key_prefix: Prefix for all keys written by this store
+        """
+        self._redis = redis
+        self._key_prefix = key_prefix
+        self._all_key = f"{key_prefix}tasks"
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "a2a:", **kwargs: Any) -> "RedisTaskStore":
+        """Create a store from a Redis URL such as ``redis://localhost:6379/0``."""
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ImportError(
+                "RedisTaskStore requires the redis package: pip install redis"
+            ) from e
+        
+        return cls(Redis.from_url(url, **kwargs), key_prefix=key_prefix)
+
+    def _task_key(self, task_id: str) -> str:
+        return f"{self._key_prefix}task:{task_id}"
+
+    def _session_key(self, session_id: str) -> str:
+        return f"{self._key_prefix}session:{session_id}"
+
+    async def create_task(self, task: Task) -> Task:
+        """Create a new task."""
+        key = self._task_key(task.id)
+        created = await self._redis.set(key, task.model_dump_json(), nx=True)
+        if not created:
+            raise ValueError(f"Task with ID {task.id} already exists")
+        
+        # Update the indexes in a single round trip
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(self._all_key, task.id)
+            if task.session_id is not None:
+                pipe.sadd(self._session_key(task.session_id), task.id)
+            await pipe.execute()
+        return task
+
+    async def get_task(self, task_id: str) -> Task:
+        """Get a task by ID."""
+        data = await self._redis.get(self._task_key(task_id))
+        if data is None:
+            raise TaskNotFoundException(task_id)
+        
+        return Task.model_validate_json(data)
+
+    async def update_task(self, task: Task) -> Task:
+        """Update an existing task."""
+        key = self._task_key(task.id)
+        if task.session_id is None:
+            updated = await self._redis.set(key, task.model_dump_json(), xx=True)
+            if not updated:
+                raise TaskNotFoundException(task.id)
+            return task
+        
+        # Write the task and index its session in a single round trip
+        session_key = self._session_key(task.session_id)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, task.model_dump_json(), xx=True)
+            pipe.sadd(session_key, task.id)
+            updated, indexed = await pipe.execute()
+        
+        if not updated:
+            # Undo the index entry for a task that does not exist
+            if indexed:
+                await self._redis.srem(session_key, task.id)
+            raise TaskNotFoundException(task.id)
+        return task
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Delete a task by ID."""
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.get(self._task_key(task_id))
+            pipe.delete(self._task_key(task_id))
+            data, deleted = await pipe.execute()
+        
+        if not deleted:
+            return False
+        
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.srem(self._all_key, task_id)
+            # Only the session id is needed, so skip validating the task
+            session_id = json_loads(data).get("session_id")
+            if session_id is not None:
+                pipe.srem(self._session_key(session_id), task_id)
+            await pipe.execute()
+        return True
+
+    async def list_tasks(self, session_id: Optional[str] = None) -> List[Task]:
+        """List tasks, optionally filtered by session ID."""
+        index_key = self._all_key if session_id is None else self._session_key(session_id)
+        task_ids = await self._redis.smembers(index_key)
+        if not task_ids:
+            return []
+        
+        keys = [
+            self._task_key(task_id.decode() if isinstance(task_id, bytes) else task_id)
+            for task_id in task_ids
+        ]
+        tasks = [
+            Task.model_validate_json(data)
+            for data in await self._redis.mget(keys)
+            if data is not None
+        ]
+        
+        # Session index entries can be stale if a task moved to another session
+        if session_id is not None:
+            tasks = [task for task in tasks if task.session_id == session_id]
+        
+        return tasks
+
+    async def task_exists(self, task_id: str) -> bool:
+        """Check if a task exists."""
+        return bool(await self._redis.exists(self._task_key(task_id)))
@@ -1,12 +1,26 @@
 """Basic tests for A2A Python SDK."""
 
+import os
+import subprocess
+import sys
 import pytest
 import uuid
-from a2a.models.message import Message, MessageRole, TextPart
+import httpx
+from fastapi import FastAPI, Request, Response
+from pydantic import ValidationError
+import a2a
+from a2a._json import _stdlib_dumps, loads
+from a2a.client.a2a_client import A2AClient, _SSEDecoder
+from a2a.client.card_resolver import A2ACardResolver
+from a2a.exceptions import A2AClientException, TaskNotFoundException
+from a2a.integrations.fastapi import add_a2a_routes
+from a2a.models.message import Message, MessageRole, TextPart, FilePart, DataPart
 from a2a.models.agent_card import AgentCard, AgentCapabilities
-from a2a.models.task import Task, TaskStatus, TaskState, TaskSendParams
-from a2a.server.task_store import InMemoryTaskStore
-from a2a.server.task_manager import TaskManager
+from a2a.models.task import (
+    Task, TaskStatus, TaskState, TaskSendParams, TaskStatusUpdateEvent
+)
+from a2a.server.task_store import InMemoryTaskStore, RedisTaskStore
+from a2a.server.task_manager import TaskManager, _status_update
 from datetime import datetime
 
 
@@ -26,6 +40,19 @@ class TestModels:
         assert message.parts[0].text == "Hello, world!"
         assert message.parts[0].type == "text"
     
+    def test_message_part_dispatch(self):
+        """Test that parts validate by their type tag, inferred when omitted."""
+        message = Message.model_validate({
+            "role": "user",
+            "parts": [
+                {"type": "file", "file": {"name": "notes.txt"}},
+                {"data": {"key": "value"}},
+                {"text": "Hello"},
+            ]
+        })
+        
+        assert [type(part) for part in message.parts] == [FilePart, DataPart, TextPart]
+    
     def test_agent_card_creation(self):
         """Test creating an agent card."""
         card = AgentCard(
@@ -40,6 +67,10 @@ class TestModels:
         assert card.name == "Test Agent"
         assert card.capabilities.streaming is True
         assert card.capabilities.push_notifications is False
+        
+        # Cards are immutable so cached instances can be shared safely
+        with pytest.raises(ValidationError):
+            card.name = "Renamed Agent"
     
     def test_task_creation(self):
         """Test creating a task."""
@@ -59,9 +90,12 @@ class TestModels:
 class TestTaskStore:
     """Test task store implementations."""
     
-    @pytest.fixture
-    def task_store(self):
-        """Create a fresh task store for each test."""
+    @pytest.fixture(params=["memory", "redis"])
+    def task_store(self, request):
+        """Create a fresh task store of each implementation for each test."""
+        if request.param == "redis":
+            fakeredis = pytest.importorskip("fakeredis")
+            return RedisTaskStore(fakeredis.FakeAsyncRedis())
         return InMemoryTaskStore()
     
     @pytest.fixture
@@ -143,6 +177,44 @@ class TestTaskStore:
         
         session2_tasks = await task_store.list_tasks("session-2")
         assert len(session2_tasks) == 1
+    
+    async def test_list_tasks_tracks_session_changes(self, task_store):
+        """Test that session listings follow updates and deletes."""
+        task = Task(
+            id="task-1",
+            session_id="session-1",
+            status=TaskStatus(state=TaskState.SUBMITTED, timestamp=datetime.utcnow())
+        )
+        await task_store.create_task(task)
+        
+        moved_task = task.model_copy(update={"session_id": "session-2"})
+        await task_store.update_task(moved_task)
+        assert await task_store.list_tasks("session-1") == []
+        assert await task_store.list_tasks("session-2") == [moved_task]
+        
+        await task_store.delete_task(task.id)
+        assert await task_store.list_tasks("session-2") == []
+    
+    async def test_task_manager_round_trip(self, task_store):
+        """Test a task created and continued through a task manager."""
+        task_manager = TaskManager(task_store)
+        
+        async def echo(message):
+            return Message(role=MessageRole.AGENT, parts=message.parts)
+        
+        task_manager.on_message_received = echo
+        message = Message(role=MessageRole.USER, parts=[TextPart(text="Hello")])
+        task = await task_manager.create_task(
+            TaskSendParams(session_id="session-1", message=message)
+        )
+        await task_manager.send_task_message(
+            task.id, TaskSendParams(message=message)
+        )
+        
+        stored = await task_store.get_task(task.id)
+        assert stored.status.state == TaskState.COMPLETED
+        assert len(stored.history) == 4
+        assert [t.id for t in await task_store.list_tasks("session-1")] == [task.id]
 
 
 class TestTaskManager:
@@ -199,4 +271,321 @@ class TestTaskManager:
         
         card = await task_manager.get_agent_card("http://localhost:8000/test")
         assert card.name == "Test Agent"
-        assert card.url == "http://localhost:8000/test"
\ No newline at end of file
+        assert card.url == "http://localhost:8000/test"
+    
+    def test_status_update_matches_event_model(self):
+        """Test that streamed status updates keep the TaskStatusUpdateEvent shape."""
+        status = TaskStatus(state=TaskState.COMPLETED, timestamp=datetime.utcnow())
+        event = _status_update("task-1", status, final=True)
+        
+        assert event["type"] == "status_update"
+        assert event["data"] == TaskStatusUpdateEvent(
+            id="task-1", status=status, final=True
+        ).model_dump()
+
+
+class TestPackageExports:
+    """Test the package-level exports."""
+    
+    def test_all_exports_resolve(self):
+        """Test that every name in __all__ can be imported from the package."""
+        for name in a2a.__all__:
+            assert getattr(a2a, name) is not None
+        
+        assert a2a.Message is Message
+        assert a2a.TaskManager is TaskManager
+    
+    def test_subpackages_resolve(self):
+        """Test that subpackages are reachable as attributes of the package."""
+        # Run in a fresh interpreter, where this module's imports have not
+        # already bound the subpackages
+        code = (
+            "import a2a\n"
+            "for name in ('client', 'models', 'server', 'integrations'):\n"
+            "    assert getattr(a2a, name).__name__ == 'a2a.' + name\n"
+            "assert not hasattr(a2a, 'importlib')\n"
+        )
+        src_dir = os.path.dirname(os.path.dirname(a2a.__file__))
+        env = dict(os.environ, PYTHONPATH=src_dir)
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+class TestClientIntegration:
+    """Test the client against the FastAPI integration in-process."""
+    
+    @pytest.fixture
+    def app(self):
+        """Create a FastAPI app hosting an echo agent under /echo."""
+        async def echo_handler(message: Message) -> Message:
+            return Message(
+                role=MessageRole.AGENT,
+                parts=[TextPart(text=f"Echo: {message.parts[0].text}")]
+            )
+        
+        async def card_handler(agent_url: str) -> AgentCard:
+            return AgentCard(
+                name="Echo Agent",
+                url=agent_url,
+                version="1.0.0",
+                capabilities=AgentCapabilities(streaming=True),
+                skills=[]
+            )
+        
+        task_manager = TaskManager()
+        task_manager.on_message_received = echo_handler
+        task_manager.on_agent_card_query = card_handler
+        
+        app = FastAPI()
+        add_a2a_routes(app, task_manager, "/echo")
+        return app
+    
+    @pytest.fixture
+    async def transport(self, app):
+        """Create a transport that sends requests to the app without a network."""
+        transport = httpx.ASGITransport(app=app)
+        yield transport
+        await transport.aclose()
+    
+    @pytest.fixture
+    async def client(self, transport):
+        """Create an A2AClient that talks to the app."""
+        async with A2AClient("http://testserver/echo", transport=transport) as client:
+            yield client
+    
+    @pytest.fixture
+    async def resolver(self, transport):
+        """Create an A2ACardResolver that talks to the app."""
+        async with A2ACardResolver("http://testserver", transport=transport) as resolver:
+            yield resolver
+    
+    async def test_discover_agents(self, resolver):
+        """Test that discovery only returns paths hosting an agent."""
+        agents = await resolver.discover_agents()
+        assert list(agents) == ["/echo"]
+        assert agents["/echo"].url == "http://testserver/echo"
+    
+    async def test_agent_card_cache(self, resolver, transport):
+        """Test that the resolver reuses a fresh card and refetches a stale one."""
+        card = await resolver.get_agent_card("/echo")
+        assert await resolver.get_agent_card("/echo") is card
+        
+        async with A2ACardResolver(
+            "http://testserver", transport=transport, card_ttl=0
+        ) as stale_resolver:
+            card = await stale_resolver.get_agent_card("/echo")
+            assert await stale_resolver.get_agent_card("/echo") is not card
+    
+    async def test_agent_card_revalidation(self):
+        """Test that a stale card answered with 304 Not Modified is reused."""
+        card = AgentCard(
+            name="Echo Agent",
+            url="http://testserver/echo",
+            version="1.0.0",
+            capabilities=AgentCapabilities()
+        )
+        etag = '"card-v1"'
+        revalidations = []
+        
+        app = FastAPI()
+        
+        @app.get("/echo/card")
+        async def get_card(request: Request):
+            if request.headers.get("if-none-match") == etag:
+                revalidations.append(etag)
+                return Response(status_code=304, headers={"ETag": etag})
+            return Response(
+                content=card.model_dump_json(),
+                media_type="application/json",
+                headers={"ETag": etag}
+            )
+        
+        transport = httpx.ASGITransport(app=app)
+        async with A2ACardResolver(
+            "http://testserver", transport=transport, card_ttl=0
+        ) as resolver:
+            first = await resolver.get_agent_card("/echo")
+            assert await resolver.get_agent_card("/echo") is first
+        
+        assert revalidations == [etag]
+    
+    async def test_get_agent_card(self, client):
+        """Test fetching the agent card."""
+        card = await client.get_agent_card()
+        assert card.name == "Echo Agent"
+        assert card.url == "http://testserver/echo"
+    
+    async def test_send_message(self, client):
+        """Test sending a message."""
+        response = await client.send_message(
+            Message(role=MessageRole.USER, parts=[TextPart(text="Hello")])
+        )
+        assert response.parts[0].text == "Echo: Hello"
+    
+    async def test_send_message_stream(self, client):
+        """Test streaming a message response."""
+        events = [
+            event async for event in client.send_message_stream(
+                Message(role=MessageRole.USER, parts=[TextPart(text="Hello")])
+            )
+        ]
+        assert len(events) == 1
+        assert events[0]["parts"][0]["text"] == "Echo: Hello"
+    
+    async def test_task_lifecycle(self, client):
+        """Test creating, fetching and messaging a task."""
+        params = TaskSendParams(
+            session_id="session-1",
+            message=Message(role=MessageRole.USER, parts=[TextPart(text="Hello")])
+        )
+        task = await client.create_task(params)
+        assert task.status.state == TaskState.COMPLETED
+        
+        retrieved_task = await client.get_task(task.id)
+        assert len(retrieved_task.history) == 2
+        
+        updated_task = await client.send_task_message(task.id, params)
+        assert len(updated_task.history) == 4
+        
+        limited_task = await client.send_task_message(task.id, params, history_length=1)
+        assert len(limited_task.history) == 1
+        
+        limited_task = await client.get_task(task.id, history_length=1)
+        assert len(limited_task.history) == 1
+        
+        # Limiting the returned history leaves the stored task intact
+        retrieved_task = await client.get_task(task.id)
+        assert len(retrieved_task.history) == 6
+    
+    async def test_send_task_message_stream(self, client):
+        """Test streaming task status updates."""
+        params = TaskSendParams(
+            message=Message(role=MessageRole.USER, parts=[TextPart(text="Hello")])
+        )
+        task = await client.create_task(params)
+        
+        events = [
+            event async for event in client.send_task_message_stream(task.id, params)
+        ]
+        assert [event["status"]["state"] for event in events] == ["working", "completed"]
+        assert events[-1]["final"] is True
+    
+    async def test_shared_client_pool(self):
+        """Test that shared clients reuse one pool until the last one closes."""
+        first = A2AClient("http://testserver/echo", shared=True)
+        second = A2AClient("http://testserver/echo", shared=True)
+        assert first.client is second.client
+        
+        await first.close()
+        assert not second.client.is_closed
+        
+        await second.close()
+        assert second.client.is_closed
+    
+    async def test_shared_pool_replaced_after_close(self):
+        """Test that releasing a replaced shared pool leaves its successor open."""
+        stale = A2AClient("http://testserver/echo", shared=True)
+        await stale.client.aclose()
+        
+        fresh = A2AClient("http://testserver/echo", shared=True)
+        assert fresh.client is not stale.client
+        
+        await stale.close()
+        assert not fresh.client.is_closed
+        
+        await fresh.close()
+        assert fresh.client.is_closed
+    
+    async def test_transport_outlives_client(self, transport):
+        """Test that closing a client leaves a caller-provided transport usable."""
+        async with A2AClient("http://testserver/echo", transport=transport):
+            pass
+        
+        async with A2AClient("http://testserver/echo", transport=transport) as client:
+            card = await client.get_agent_card()
+        assert card.name == "Echo Agent"
+    
+    async def test_redirect_is_an_error(self):
+        """Test that a redirect response is reported as an HTTP error."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(301, headers={"Location": "/moved"})
+        )
+        message = Message(role=MessageRole.USER, parts=[TextPart(text="Hello")])
+        params = TaskSendParams(message=message)
+        async with A2AClient("http://testserver/echo", transport=transport) as client:
+            with pytest.raises(A2AClientException, match="301"):
+                await client.send_message(message)
+            with pytest.raises(A2AClientException, match="301"):
+                await client.get_task("task-1")
+            with pytest.raises(A2AClientException, match="301"):
+                await client.get_agent_card()
+            for stream in (
+                client.send_message_stream(message),
+                client.send_task_message_stream("task-1", params),
+                client.resubscribe_task("task-1"),
+            ):
+                with pytest.raises(A2AClientException, match="301"):
+                    async for _ in stream:
+                        pass
+        
+        async with A2ACardResolver("http://testserver", transport=transport) as resolver:
+            with pytest.raises(A2AClientException, match="301"):
+                await resolver.get_agent_card("/echo")
+    
+    async def test_get_missing_task(self, client):
+        """Test that fetching an unknown task raises TaskNotFoundException."""
+        with pytest.raises(TaskNotFoundException):
+            await client.get_task("missing-task")
+
+
+class TestJSON:
+    """Test the JSON helpers."""
+    
+    def test_stdlib_fallback_serializes_model_dumps(self):
+        """Test that the stdlib encoder handles datetimes and enums like orjson."""
+        status = TaskStatus(state=TaskState.WORKING, timestamp=datetime(2025, 1, 2, 3, 4, 5))
+        data = loads(_stdlib_dumps(status.model_dump()))
+        
+        assert data == {"state": "working", "message": None, "timestamp": "2025-01-02T03:04:05"}
+
+
+class TestSSEDecoder:
+    """Test the client's server-sent event decoder."""
+    
+    def test_fragmented_events(self):
+        """Test events split across arbitrary chunk boundaries."""
+        stream = b'\xef\xbb\xbfdata: {"a": 1}\r\n\r\n: comment\ndata: {"b": 2}\n\n'
+        decoder = _SSEDecoder()
+        events = []
+        for i in range(len(stream)):
+            events.extend(decoder.feed(stream[i:i + 1]))
+        events.extend(decoder.flush())
+        
+        assert events == [b'{"a": 1}', b'{"b": 2}']
+    
+    def test_multiline_and_unterminated_events(self):
+        """Test multi-line data fields and an event cut off at end of stream."""
+        decoder = _SSEDecoder()
+        assert decoder.feed(b"data: [1,\ndata:2]\n\ndata: 3") == [b"[1,\n2]"]
+        assert decoder.flush() == [b"3"]
+    
+    def test_cr_line_endings(self):
+        """Test lone CR line endings, including a CRLF split across chunks."""
+        decoder = _SSEDecoder()
+        assert decoder.feed(b"data: 1\r\rdata: 2\rdata: 3\r") == [b"1"]
+        assert decoder.feed(b"\r") == [b"2\n3"]
+        assert decoder.feed(b"data: 4\r") == []
+        assert decoder.feed(b"\n\r\n") == [b"4"]
+        assert decoder.feed(b"data: 5\r") == []
+        assert decoder.flush() == [b"5"]
+    
+    def test_large_event_in_many_chunks(self):
+        """Test an event much larger than the chunks it arrives in."""
+        payload = b'"' + b"x" * 100000 + b'"'
+        stream = b"data: " + payload + b"\r\n\r\n"
+        decoder = _SSEDecoder()
+        events = []
+        for i in range(0, len(stream), 4096):
+            events.extend(decoder.feed(stream[i:i + 4096]))
+        
+        assert events == [payload]
+        assert decoder.flush() == []